@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -----------------------------------------------------------------------------
+# qwiic_gpio_bench.py
+#
+# Measures the cost of each QwiicGPIO method against the simulated driver: calls per
+# second, p50/p99 latency, I2C transactions and bytes per call, and memory allocated
+# per call.
+#
+# Usage, from the repository root (qwiic_i2c must be installed):
+#   PYTHONPATH=. python benchmarks/qwiic_gpio_bench.py [--iterations N] [--latency SECONDS]
+#                                                        [--filter TEXT] [--json FILE]
+#
+# --json writes machine-readable results so runs from different releases can be compared.
+# ------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+# ==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ==================================================================================
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+# Each case is (name, setup, call). setup(device) runs once before timing; call(device, i)
+# is timed, i being the iteration number so writes can alternate values and actually
+# reach the bus instead of being skipped by the register cache.
+#
+# The simulated chip behaves like the real TCA9534 and does not auto-increment its
+# register pointer. Cases named in _AUTO_INCREMENT_CASES run against a chip that does,
+# to show what block reads would save on parts that support them.
+
+def _setInputs(device):
+    device.setModeMask(0xFF)
+
+def _setOutputs(device):
+    device.setModeMask(0x00)
+
+def _enableBurst(device):
+    device.burst_read = True
+
+_CASES = [
+    ("digitalWrite (toggle)", _setOutputs, lambda d, i: d.digitalWrite(0, i & 1)),
+    ("digitalWrite (unchanged)", _setOutputs, lambda d, i: d.digitalWrite(0, 1)),
+    ("digitalWritePort", _setOutputs, lambda d, i: d.digitalWritePort([i & 1] * 8)),
+    ("writePortMask", _setOutputs, lambda d, i: d.writePortMask(i & 0xFF)),
+    ("digitalRead", _setInputs, lambda d, i: d.digitalRead(0)),
+    ("digitalReadPort", _setInputs, lambda d, i: d.digitalReadPort()),
+    ("readPortMask", _setInputs, lambda d, i: d.readPortMask()),
+    ("getGPIO", _setInputs, lambda d, i: d.getGPIO()),
+    ("setGPIO", _setOutputs, lambda d, i: d.setGPIO()),
+    ("pinMode", None, lambda d, i: d.pinMode(0, i & 1)),
+    ("pinModePort", None, lambda d, i: d.pinModePort([i & 1] * 8)),
+    ("setModeMask", None, lambda d, i: d.setModeMask(i & 0xFF)),
+    ("getMode", None, lambda d, i: d.getMode()),
+    ("invertPin", None, lambda d, i: d.invertPin(0, i & 1)),
+    ("invertPinPort", None, lambda d, i: d.invertPinPort([i & 1] * 8)),
+    ("setInversionMask", None, lambda d, i: d.setInversionMask(i & 0xFF)),
+    ("getInversion", None, lambda d, i: d.getInversion()),
+    ("snapshot", None, lambda d, i: d.snapshot()),
+    ("snapshot (burst, auto-increment)", _enableBurst, lambda d, i: d.snapshot()),
+    ("batch (8 x pinMode + digitalWrite)", None, lambda d, i: _batchSetup(d, i)),
+]
+
+_AUTO_INCREMENT_CASES = ("snapshot (burst, auto-increment)",)
+
+def _batchSetup(device, i):
+    with device.batch():
+        for pin in range(device.NUM_GPIO):
+            device.pinMode(pin, device.GPIO_OUT)
+            device.digitalWrite(pin, (i + pin) & 1)
+
+def _percentile(sortedValues, fraction):
+    index = int(round(fraction * (len(sortedValues) - 1)))
+    return sortedValues[index]
+
+def runCase(name, setup, call, iterations, latency, autoIncrement=False):
+    """!
+    Benchmark one case on a fresh simulated device.
+
+    @param name: The case name.
+    @param setup: Called once with the device before timing, or None.
+    @param call: The timed function, called as call(device, iteration).
+    @param iterations: The number of timed calls.
+    @param latency: Simulated seconds per bus transaction.
+    @param autoIncrement: Simulate a chip that auto-increments its register pointer.
+
+    @return **dict** The results for this case.
+    """
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver(latency=latency, autoIncrement=autoIncrement)
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    if setup != None:
+        setup(device)
+
+    # Warm up the cache and any lazily built state
+    for i in range(min(iterations, 100)):
+        call(device, i)
+
+    driver.resetStatistics()
+    samples = [0] * iterations
+    perfCounter = time.perf_counter_ns
+
+    start = perfCounter()
+    for i in range(iterations):
+        t0 = perfCounter()
+        call(device, i)
+        samples[i] = perfCounter() - t0
+    elapsed = perfCounter() - start
+
+    transactions = driver.transactionCount
+    busBytes = driver.bytesTransferred
+
+    # Memory allocated during a call, measured separately because tracing slows
+    # every allocation down
+    allocIterations = min(iterations, 1000)
+    tracemalloc.start()
+    allocPeak = 0
+    for i in range(allocIterations):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        call(device, i)
+        allocPeak += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    samples.sort()
+
+    return {
+        "name": name,
+        "iterations": iterations,
+        "ops_per_sec": iterations / (elapsed / 1e9) if elapsed else None,
+        "p50_us": _percentile(samples, 0.50) / 1000.0,
+        "p99_us": _percentile(samples, 0.99) / 1000.0,
+        "transactions_per_op": transactions / float(iterations),
+        "bus_bytes_per_op": busBytes / float(iterations),
+        "alloc_bytes_per_op": allocPeak / float(allocIterations),
+    }
+
+def runBenchmark(iterations=10000, latency=0.0, caseFilter=None):
+    """!
+    Run every benchmark case.
+
+    @param iterations: The number of timed calls per case.
+    @param latency: Simulated seconds per bus transaction.
+    @param caseFilter: Only run cases whose name contains this text.
+
+    @return **list** One result dict per case.
+    """
+    results = []
+
+    for name, setup, call in _CASES:
+        if caseFilter and caseFilter not in name:
+            continue
+        results.append(runCase(name, setup, call, iterations, latency,
+                               name in _AUTO_INCREMENT_CASES))
+
+    return results
+
+def printResults(results):
+    print("%-36s %12s %9s %9s %8s %8s %9s" % ("method", "ops/sec", "p50 us", "p99 us",
+                                              "txn/op", "B/op", "alloc B"))
+    for r in results:
+        print("%-36s %12.0f %9.2f %9.2f %8.2f %8.1f %9.1f" % (r["name"], r["ops_per_sec"],
+              r["p50_us"], r["p99_us"], r["transactions_per_op"], r["bus_bytes_per_op"],
+              r["alloc_bytes_per_op"]))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark QwiicGPIO methods against the simulated driver")
+    parser.add_argument("--iterations", type=int, default=10000, help="timed calls per method")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per bus transaction")
+    parser.add_argument("--filter", default=None, help="only run methods whose name contains this text")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file ('-' for stdout)")
+    args = parser.parse_args()
+
+    results = runBenchmark(args.iterations, args.latency, args.filter)
+
+    if args.json == "-":
+        json.dump({"python": sys.version, "results": results}, sys.stdout, indent=2)
+        print()
+    else:
+        printResults(results)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({"python": sys.version, "results": results}, f, indent=2)
@@ -52,7 +52,19 @@ New to qwiic? Take a look at the entire [SparkFun qwiic ecosystem](https://www.s
 #-----------------------------------------------------------------------------
 
 import math
+import time
 import qwiic_i2c
+from collections import namedtuple
+
+# threading is not available on every MicroPython port. Only the optional background
+# helpers need it, so the core driver still works without it.
+try:
+    import threading
+except ImportError:
+    threading = None
+
+# Guards the lazy creation of each QwiicGPIO's cache lock
+_lockGuard = threading.Lock() if threading != None else None
 
 # Define the device name and I2C addresses. These are set in the class defintion 
 # as class variables, making them avilable without having to create a class instance.
@@ -67,6 +79,94 @@ _DEFAULT_NAME = "Qwiic GPIO"
 # device.
 _AVAILABLE_I2C_ADDRESS = [0x27, 0x26, 0x25, 0x24, 0x23, 0x22, 0x21, 0x20]
 
+# Immutable copy of all four device registers, returned by QwiicGPIO.snapshot()
+GPIOSnapshot = namedtuple("GPIOSnapshot", ["input", "output", "inversion", "configuration"])
+
+# A list-like view of one 8 bit register held in the QwiicGPIO shadow register
+# cache. Indexing a view reads a single bit of the cached byte and assigning to an
+# index sets or clears that bit, so code written against the original per-pin lists
+# (myGPIO.modes[0] = myGPIO.GPIO_IN; myGPIO.setMode()) keeps working unchanged.
+
+class _RegisterView(object):
+    """!
+    Sequence view over a single cached GPIO register byte.
+
+    @param device: The QwiicGPIO object that owns the register cache.
+    @param register: The register address this view represents.
+    """
+    __slots__ = ("_device", "_register")
+
+    def __init__(self, device, register):
+        self._device = device
+        self._register = register
+
+    def __len__(self):
+        return 8
+
+    def __getitem__(self, index):
+        value = self._device._shadow[self._register]
+        if isinstance(index, slice):
+            return [(value >> i) & 1 for i in range(8)[index]]
+        if index < 0:
+            index += 8
+        if index < 0 or index > 7:
+            raise IndexError("GPIO pin index out of range")
+        return (value >> index) & 1
+
+    def __setitem__(self, index, bitValue):
+        if index < 0:
+            index += 8
+        if index < 0 or index > 7:
+            raise IndexError("GPIO pin index out of range")
+        # In lazy_sync mode, load the chip's value before changing one bit of it
+        self._device._syncRegister(self._register)
+        shadow = self._device._shadow
+        if bitValue:
+            shadow[self._register] |= (1 << index)
+        else:
+            shadow[self._register] &= ~(1 << index) & 0xFF
+
+    def __iter__(self):
+        value = self._device._shadow[self._register]
+        for i in range(8):
+            yield (value >> i) & 1
+
+    def __eq__(self, other):
+        try:
+            return len(other) == 8 and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        return repr(list(self))
+
+# Context manager returned by QwiicGPIO.batch(). Writes made while it is active only
+# update the shadow registers; each changed register is written once when the
+# outermost batch exits.
+
+class _GPIOBatch(object):
+    """!
+    Deferred-flush context for a QwiicGPIO object.
+
+    @param device: The QwiicGPIO object to batch writes for.
+    """
+    def __init__(self, device):
+        self._device = device
+
+    def __enter__(self):
+        self._device._batchDepth += 1
+        return self._device
+
+    def __exit__(self, excType, excValue, traceback):
+        self._device._batchDepth -= 1
+        if self._device._batchDepth == 0:
+            self._device.flush()
+        return False
+
 # define the class that encapsulates the device being created. All information associated with this
 # device is encapsulated by this class. The device class should be the only value exported 
 # from this module.
@@ -79,9 +179,21 @@ class QwiicGPIO(object):
                     If not provided, the default address is used.
     @param i2c_driver: An existing i2c driver object. If not provided 
                     a driver object is created.
+    @param lazy_sync: If True, the current value of a register is read from the chip
+                    the first time a single pin of it is changed, either through a
+                    method or by item assignment such as modes[0] = GPIO_IN, instead
+                    of assuming every pin is an output, LOW and not inverted.
+                    Configuration set up by another program is then kept.
 
     @return **Object** The GPIO device object.
     """
+    # Instances keep their state in fixed slots rather than a per-instance dict, which
+    # keeps the memory cost of programs that manage many expanders low.
+    __slots__ = ("address", "_i2c", "_shadow", "_chip", "_known", "_failed", "lazy_sync", "burst_read",
+                 "_batchDepth", "_dirty", "_pinCallbacks", "_interruptWatcher",
+                 "_inputListeners", "instrumentation", "verification", "_sharedState",
+                 "_lock", "__weakref__")
+
     # Constructor
     device_name         = _DEFAULT_NAME
     available_addresses = _AVAILABLE_I2C_ADDRESS
@@ -104,8 +216,13 @@ class QwiicGPIO(object):
 
     NUM_GPIO = 8
 
+    # Edge selection for attachInterrupt()
+    RISING = 1
+    FALLING = 2
+    CHANGE = 3
+
     # Constructor
-    def __init__(self, address=None, i2c_driver=None):
+    def __init__(self, address=None, i2c_driver=None, lazy_sync=False):
 
         # Did the user specify an I2C address?
         self.address = address if address != None else self.available_addresses[0]
@@ -120,11 +237,438 @@ class QwiicGPIO(object):
         else:
             self._i2c = i2c_driver
 
-        # This list will hold the inversion status of each pin
-        self.inversions = [self.NO_INVERT] * self.NUM_GPIO 
-        self.modes = [self.GPIO_OUT] * self.NUM_GPIO # These are the mode settings for each pin
-        self.out_statuses = [self.GPIO_LO] * self.NUM_GPIO  # These are the output settings for each pin
-        self.in_statuses = [self.GPIO_LO] * self.NUM_GPIO # These are the input settings for each pin
+        # Shadow register cache, indexed by register address. _shadow holds the byte
+        # we want each register to contain and _chip holds the byte last written to
+        # (or read from) the chip; bit n of _known[0] is set once _chip[n] is valid.
+        # Writes are skipped when the two already match. All pins start as outputs,
+        # LOW and not inverted.
+        self._shadow = bytearray(4)
+        self._chip = bytearray(4)
+        self._known = bytearray(1)
+        self.lazy_sync = lazy_sync
+
+        # Bit n is set while the last write to register n raised, so the chip may not
+        # hold _shadow[n]. verifyState() checks these registers even though their chip
+        # value is no longer known.
+        self._failed = 0
+
+        # Cross-process register cache and lock, set by enableSharedState()
+        self._sharedState = None
+
+        # Thread lock for the register cache, used when shared state is off. It is
+        # created by _getLock() when a background thread or a fresh bit operation
+        # first needs it, so single threaded use pays nothing for it.
+        self._lock = None
+
+        # Can snapshot() read all four registers with one block read? The TCA9534 does
+        # not auto-increment its register pointer, so this is off unless enabled. None
+        # means check it: the next snapshot() compares a block read with single reads.
+        self.burst_read = False
+
+        # Nesting depth of batch() blocks. Register writes are deferred while non-zero,
+        # and _dirty has bit n set for each register n with a deferred write.
+        self._batchDepth = 0
+        self._dirty = 0
+
+        # Per-pin edge callbacks, each None or an (edge, callback) tuple. The list is
+        # only created once a callback is attached.
+        self._pinCallbacks = None
+        self._interruptWatcher = None
+
+        # Functions called with every byte read from the input register
+        self._inputListeners = ()
+
+        # Bus statistics, set by enableInstrumentation()
+        self.instrumentation = None
+
+        # Chip reset detection settings and counters, set by enableVerification()
+        self.verification = None
+
+    # ----------------------------------
+    # Per-pin list views
+    #
+    # These replace the plain lists used by earlier versions of this library. They can be
+    # read and indexed like lists, and assigning a whole list packs it into the register.
+    # A view holds no data of its own, so a new one is handed out on each access and a
+    # caller's list is never stored by reference.
+
+    @property
+    def inversions(self):
+        """!
+        The inversion status of each pin.
+        """
+        return _RegisterView(self, self.REG_INVERSION)
+
+    @inversions.setter
+    def inversions(self, values):
+        self._shadow[self.REG_INVERSION] = self._packList(values)
+
+    @property
+    def modes(self):
+        """!
+        The mode settings for each pin.
+        """
+        return _RegisterView(self, self.REG_CONFIGURATION)
+
+    @modes.setter
+    def modes(self, values):
+        self._shadow[self.REG_CONFIGURATION] = self._packList(values)
+
+    @property
+    def out_statuses(self):
+        """!
+        The output settings for each pin.
+        """
+        return _RegisterView(self, self.REG_OUTPUT_PORT)
+
+    @out_statuses.setter
+    def out_statuses(self, values):
+        self._shadow[self.REG_OUTPUT_PORT] = self._packList(values)
+
+    @property
+    def in_statuses(self):
+        """!
+        The input values for each pin, as of the last read.
+        """
+        return _RegisterView(self, self.REG_INPUT_PORT)
+
+    @in_statuses.setter
+    def in_statuses(self, values):
+        self._shadow[self.REG_INPUT_PORT] = self._packList(values)
+
+    def _packList(self, values):
+        """!
+        Pack a list of 8 per-pin values into a register byte.
+
+        @param values: A list of 8 values, bit 0 first. Truthy values set the bit.
+
+        @return **8 bit unsigned integer** The packed byte.
+        """
+        tempData = 0
+
+        for i in range(self.NUM_GPIO):
+            if values[i]:
+                tempData |= 1 << i
+
+        return tempData
+
+    # ----------------------------------
+    # Shadow register access
+    #
+    # All register traffic goes through these two methods so the cache stays in step
+    # with the chip.
+
+    def _writeRegister(self, register, value):
+        """!
+        Write a byte to a register, skipping the bus transaction if the chip is already
+        known to hold that value.
+
+        @param register: The register address to write.
+        @param value: The byte to write.
+
+        @return  No return value
+        """
+        value &= 0xFF
+
+        lock = self._sharedState
+        if lock == None:
+            lock = self._lock
+        if lock != None:
+            lock.acquire()
+
+        try:
+            self._shadow[register] = value
+            cached = self._known[0] & (1 << register) and self._chip[register] == value
+
+            if self._batchDepth and not cached:
+                self._dirty |= 1 << register
+                return
+
+            # Skipped writes still count towards verification below. A control loop that
+            # keeps re-asserting the same levels after a brown-out only ever makes these.
+            if not cached:
+                try:
+                    self._i2c.writeByte(self.address, register, value)
+                except Exception:
+                    # The write may or may not have reached the chip
+                    self._known[0] &= ~(1 << register)
+                    self._failed |= 1 << register
+                    raise
+
+                self._chip[register] = value
+                self._known[0] |= 1 << register
+                self._failed &= ~(1 << register)
+        finally:
+            if lock != None:
+                lock.release()
+
+        if self.verification != None:
+            self.verification._afterAccess(self, True)
+
+    def _readRegister(self, register):
+        """!
+        Read a byte from a register and update the cached value.
+
+        @param register: The register address to read.
+
+        @return **8 bit unsigned integer** The value of the register.
+        """
+        lock = self._sharedState
+        if lock == None:
+            lock = self._lock
+        if lock != None:
+            lock.acquire()
+
+        try:
+            value = self._i2c.readByte(self.address, register) & 0xFF
+            self._storeRegister(register, value)
+        finally:
+            if lock != None:
+                lock.release()
+
+        if self.verification != None:
+            self.verification._afterAccess(self, False)
+
+        return value
+
+    def _storeRegister(self, register, value):
+        """!
+        Record a byte read from the chip in the cache. Changes to the input register
+        are passed on to any attached pin callbacks.
+
+        @param register: The register address that was read.
+        @param value: The byte read.
+
+        @return  No return value
+        """
+        previous = self._chip[register]
+        wasKnown = self._known[0] & (1 << register)
+        self._shadow[register] = value
+        self._chip[register] = value
+        self._known[0] |= 1 << register
+        self._failed &= ~(1 << register)
+
+        if register != self.REG_INPUT_PORT:
+            return
+
+        for listener in self._inputListeners:
+            listener(value)
+
+        if wasKnown and previous != value:
+            self._inputChanged(previous, value)
+
+    def _updateBit(self, register, pin, value):
+        """!
+        Set or clear a single bit of a cached register and write the result.
+
+        @param register: The register address to update.
+        @param pin: The bit to update.
+        @param value: Truthy to set the bit, falsy to clear it.
+
+        @return  No return value
+        """
+        lock = self._sharedState
+        if lock == None:
+            lock = self._lock
+        if lock != None:
+            lock.acquire()
+
+        try:
+            self._syncRegister(register)
+
+            if value:
+                newData = self._shadow[register] | (1 << pin)
+            else:
+                newData = self._shadow[register] & ~(1 << pin)
+
+            self._writeRegister(register, newData)
+        finally:
+            if lock != None:
+                lock.release()
+
+    def _writeRegisterMask(self, register, value, mask):
+        """!
+        Replace the bits selected by mask in a cached register and write the result.
+
+        @param register: The register address to update.
+        @param value: The new bit values. Bits outside mask are ignored.
+        @param mask: The bits of the register to change.
+
+        @return  No return value
+        """
+        self._modifyRegister(register, ~mask, value & mask)
+
+    def _modifyRegister(self, register, keep, flip, fresh=False):
+        """!
+        Write (old & keep) ^ flip to a register, where old is its cached value. Setting,
+        clearing, toggling and replacing any group of bits are all one such write.
+
+        @param register: The register address to update.
+        @param keep: The bits of the old value to keep.
+        @param flip: The bits to invert after masking with keep.
+        @param fresh: Read the register from the chip first, rather than trusting the
+                    cache. Skipped while a batched write to the register is pending.
+
+        @return  No return value
+        """
+        keep &= 0xFF
+
+        lock = self._sharedState
+        if lock == None:
+            lock = self._getLock() if fresh else self._lock
+        if lock != None:
+            lock.acquire()
+
+        try:
+            if fresh and not self._dirty & (1 << register):
+                self._readRegister(register)
+            elif keep:
+                self._syncRegister(register)
+
+            self._writeRegister(register, (self._shadow[register] & keep) ^ (flip & 0xFF))
+        finally:
+            if lock != None:
+                lock.release()
+
+    def _getLock(self):
+        """!
+        Get the lock guarding the register cache between threads, creating it if
+        needed. Once it exists every cache update takes it; until then (single threaded
+        use) none do. Returns None if threading is not available.
+        """
+        if self._lock == None and _lockGuard != None:
+            with _lockGuard:
+                if self._lock == None:
+                    self._lock = threading.RLock()
+
+        return self._lock
+
+    def _syncRegister(self, register):
+        """!
+        In lazy_sync mode, read a register from the chip if its value is not known yet
+        and no write to it is pending.
+
+        @param register: The register address about to be modified.
+
+        @return  No return value
+        """
+        if self.lazy_sync and not (self._known[0] | self._dirty) & (1 << register):
+            self._readRegister(register)
+
+    def invalidate(self, register=None):
+        """!
+        Forget the cached chip value of one or all registers, for example when another
+        program may have changed the device. The next write to the register always
+        reaches the bus and, in lazy_sync mode, the next single pin change reads the
+        register first.
+
+        @param register: The register address to forget. Defaults to all registers.
+
+        @return  No return value
+        """
+        if register == None:
+            self._known[0] = 0
+        else:
+            self._known[0] &= ~(1 << register)
+
+    # ----------------------------------
+    # Shared state
+    #
+    # Several processes driving the same board each have their own QwiicGPIO object.
+    # With shared state enabled their register caches live in one shared memory block
+    # and every read-modify-write holds a cross-process lock, so a change made by one
+    # process is seen by the next change another process makes.
+
+    def enableSharedState(self, name=None):
+        """!
+        Keep this device's register cache in shared memory, shared with every process
+        that enables shared state with the same name. The first process to do so
+        provides the initial cache; later ones adopt it. The block is removed when the
+        last process using it disables shared state or exits, so a later run never
+        adopts a cache from before the board may have been power-cycled. Requires a
+        POSIX system.
+
+        @param name: The name of the shared block. Defaults to one derived from the I2C
+                    bus number and device address. Required if the I2C driver does not
+                    expose its bus number.
+
+        @return  No return value
+        """
+        if self._sharedState != None:
+            return
+
+        if name == None:
+            # Linux drivers from qwiic_i2c keep the bus number in _iBus; wrappers
+            # pass the lookup through to the driver they wrap
+            bus = getattr(self._i2c, "_iBus", None)
+            if not isinstance(bus, int):
+                raise ValueError("The I2C bus of this driver is unknown; pass a name")
+            name = "qwiic_gpio_%d_%02x" % (bus, self.address)
+
+        self._sharedState = _SharedRegisterState(name, self._shadow, self._chip, self._known)
+        self._shadow = self._sharedState.shadow
+        self._chip = self._sharedState.chip
+        self._known = self._sharedState.known
+
+    def disableSharedState(self, unlink=False):
+        """!
+        Go back to a private register cache, starting from the current shared values.
+
+        @param unlink: Remove the shared block even if other processes still use it.
+                    They keep their copy, but any process enabling shared state
+                    afterwards starts a new block.
+
+        @return  No return value
+        """
+        shared = self._sharedState
+        if shared == None:
+            return
+
+        with shared:
+            self._shadow = bytearray(shared.shadow)
+            self._chip = bytearray(shared.chip)
+            self._known = bytearray(shared.known)
+            self._sharedState = None
+
+        shared.close(unlink)
+
+    # ----------------------------------
+    # batch()
+    #
+    # Group several pin changes into a single write per register.
+
+    def batch(self):
+        """!
+        Defer register writes until the end of a with block. Inside the block
+        digitalWrite(), pinMode(), invertPin() and their port versions only update the
+        cached register values. When the block exits each register that changed is
+        written once.
+
+            with myGPIO.batch():
+                for pin in range(myGPIO.NUM_GPIO):
+                    myGPIO.pinMode(pin, myGPIO.GPIO_OUT)
+                    myGPIO.digitalWrite(pin, myGPIO.GPIO_LO)
+
+        @return **Object** A context manager. Entering it returns this QwiicGPIO object.
+        """
+        return _GPIOBatch(self)
+
+    def flush(self):
+        """!
+        Write any register changed inside a batch() block, or whose cached value is
+        known to differ from the chip. Output levels are written before the
+        configuration so that pins switched to outputs start at the requested level.
+        If a write raises, it and the registers after it stay pending for the next
+        flush().
+
+        @return  No return value
+        """
+        for register in (self.REG_OUTPUT_PORT, self.REG_INVERSION, self.REG_CONFIGURATION):
+            bit = 1 << register
+            if (self._dirty | self._known[0]) & bit:
+                self._writeRegister(register, self._shadow[register])
+                if not self._batchDepth:
+                    self._dirty &= ~bit
 
     # ----------------------------------
     # isConnected()
@@ -137,7 +681,7 @@ class QwiicGPIO(object):
 
         @return **bool** True if the device is connected, otherwise False.
         """
-        return qwiic_i2c.isDeviceConnected(self.address)
+        return self._i2c.isDeviceConnected(self.address)
 
     # ----------------------------------
     # begin()
@@ -162,12 +706,7 @@ class QwiicGPIO(object):
 
         @return  No return value
         """
-        tempData = 0
-
-        for i in range (self.NUM_GPIO):
-            tempData |= self.modes[i] << i
-
-        self._i2c.writeByte(self.address, self.REG_CONFIGURATION, tempData)
+        self._writeRegister(self.REG_CONFIGURATION, self._shadow[self.REG_CONFIGURATION])
 
     #----------------------------------------------------------------
     # getMode()
@@ -179,12 +718,7 @@ class QwiicGPIO(object):
 
         @return **8 bit unsigned integer** The value of the mode register.
         """
-        tempData = self._i2c.readByte(self.address, self.REG_CONFIGURATION)
-
-        for i in range(self.NUM_GPIO):
-            self.modes[i] = (tempData & (1 << i)) >> i
-        
-        return tempData
+        return self._readRegister(self.REG_CONFIGURATION)
 
     #----------------------------------------------------------------
     # setInversion()
@@ -197,12 +731,7 @@ class QwiicGPIO(object):
 
         @return  No return value
         """
-        tempData = 0
-
-        for i in range(self.NUM_GPIO):
-            tempData |= self.inversions[i] << i
-
-        self._i2c.writeByte(self.address, self.REG_INVERSION, tempData)
+        self._writeRegister(self.REG_INVERSION, self._shadow[self.REG_INVERSION])
 
     #----------------------------------------------------------------
     # getInversion()
@@ -215,12 +744,7 @@ class QwiicGPIO(object):
 
         @return **8 bit unsigned integer** The value of the inversion register.
         """
-        tempData = self._i2c.readByte(self.address, self.REG_INVERSION)
-
-        for i in range(self.NUM_GPIO):
-            self.inversions[i] = (tempData & (1 << i)) >> i
-
-        return tempData
+        return self._readRegister(self.REG_INVERSION)
 
     #----------------------------------------------------------------
     # setGPIO()
@@ -233,12 +757,7 @@ class QwiicGPIO(object):
 
         @return  No return value
         """
-        tempData = 0
-
-        for i in range(self.NUM_GPIO):
-            tempData |= self.out_statuses[i] << i
-
-        self._i2c.writeByte(self.address, self.REG_OUTPUT_PORT, tempData)
+        self._writeRegister(self.REG_OUTPUT_PORT, self._shadow[self.REG_OUTPUT_PORT])
 
     def getGPIO(self):
         """!
@@ -246,12 +765,7 @@ class QwiicGPIO(object):
 
         @return **8 bit unsigned integer** The value of the mode register.
         """
-        tempData = self._i2c.readByte(self.address, self.REG_INPUT_PORT)
-
-        for i in range(self.NUM_GPIO):
-            self.in_statuses[i] = (tempData & (1 << i)) >> i
-
-        return tempData
+        return self._readRegister(self.REG_INPUT_PORT)
     
     def pinMode (self, pin, mode):
         """!
@@ -268,8 +782,7 @@ class QwiicGPIO(object):
         if pin < 0 or pin > 7:
             return
         
-        self.modes[pin] = mode
-        self.setMode()
+        self._updateBit(self.REG_CONFIGURATION, pin, mode)
     
     def pinModePort (self, gpioPinModeList):
         """!
@@ -283,8 +796,7 @@ class QwiicGPIO(object):
         if len(gpioPinModeList) != 8:
             return
         
-        self.modes = gpioPinModeList
-        self.setMode()
+        self.setModeMask(self._packList(gpioPinModeList))
     
     def invertPin(self, pin, invert):
         """!
@@ -298,8 +810,7 @@ class QwiicGPIO(object):
         if pin < 0 or pin > 7:
             return
         
-        self.inversions[pin] = invert
-        self.setInversion()
+        self._updateBit(self.REG_INVERSION, pin, invert)
     
     def invertPinPort (self, gpioInversionList):
         """!
@@ -313,8 +824,7 @@ class QwiicGPIO(object):
         if len(gpioInversionList) != 8:
             return
         
-        self.inversions = gpioInversionList
-        self.setInversion()
+        self.setInversionMask(self._packList(gpioInversionList))
     
     def digitalWrite(self, pin, value):
         """!
@@ -328,8 +838,7 @@ class QwiicGPIO(object):
         if pin < 0 or pin > 7:
             return
         
-        self.out_statuses[pin] = value
-        self.setGPIO()
+        self._updateBit(self.REG_OUTPUT_PORT, pin, value)
     
     def digitalWritePort (self, gpioOutputList):
         """!
@@ -343,8 +852,7 @@ class QwiicGPIO(object):
         if len(gpioOutputList) != 8:
             return
         
-        self.out_statuses = gpioOutputList
-        self.setGPIO()
+        self.writePortMask(self._packList(gpioOutputList))
 
     def digitalRead(self, pin):
         """!
@@ -357,14 +865,2825 @@ class QwiicGPIO(object):
         if pin < 0 or pin > 7:
             return
         
-        self.getGPIO()
-        return self.in_statuses[pin]
+        return (self.getGPIO() >> pin) & 1
     
     def digitalReadPort (self):
         """!
         Get the input value of all pins.
 
-        @return  A list of boolean input values of all pins.
+        @return  A list of boolean input values of all pins. The list is a copy, so it
+                 does not change on later reads.
+        """
+        value = self.getGPIO()
+        return [(value >> i) & 1 for i in range(self.NUM_GPIO)]
+
+    def pin(self, pin):
+        """!
+        Get a handle for a single pin. The pin number is checked once here, so calls on
+        the handle go straight to the register cache without any validation.
+
+            led = myGPIO.pin(3)
+            led.mode = myGPIO.GPIO_OUT
+            led.on()
+
+        @param pin: The pin number.
+
+        @return **QwiicGPIOPin** The pin handle.
+        """
+        if not isinstance(pin, int) or pin < 0 or pin > 7:
+            raise ValueError("Invalid GPIO pin: %r" % (pin,))
+
+        return QwiicGPIOPin(self, pin)
+
+    #----------------------------------------------------------------
+    # Bitmask port access
+    #
+    # These work directly on register bytes, bit 0 being GPIO 0. They avoid building
+    # per-pin lists and are the fastest way to drive or sample a whole port.
+
+    def writePortMask(self, value, mask=0xFF):
+        """!
+        Set the output value of the pins selected by mask.
+
+        @param value: The output byte. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to all 8 pins.
+
+        @return  No return value
+        """
+        self._writeRegisterMask(self.REG_OUTPUT_PORT, value, mask)
+
+    def readPortMask(self):
+        """!
+        Get the input value of all pins as a byte.
+
+        @return **8 bit unsigned integer** The value of the input register.
+        """
+        return self.getGPIO()
+
+    def setModeMask(self, value, mask=0xFF):
+        """!
+        Set the mode of the pins selected by mask. A 1 bit makes the pin an input
+        (GPIO_IN) and a 0 bit makes it an output (GPIO_OUT).
+
+        @param value: The mode byte. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to all 8 pins.
+
+        @return  No return value
+        """
+        self._writeRegisterMask(self.REG_CONFIGURATION, value, mask)
+
+    def setInversionMask(self, value, mask=0xFF):
+        """!
+        Set the input inversion of the pins selected by mask. A 1 bit inverts the pin.
+
+        @param value: The inversion byte. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to all 8 pins.
+
+        @return  No return value
+        """
+        self._writeRegisterMask(self.REG_INVERSION, value, mask)
+
+    #----------------------------------------------------------------
+    # Bit operations
+    #
+    # Set, clear, toggle or replace a group of bits in the output, inversion or
+    # configuration register with a single write. With fresh=True the register is read
+    # back first, and the read and write happen under a lock: a per-device lock, so
+    # the update is atomic against other threads making fresh updates through the same
+    # object, or the shared state lock, which also covers other processes using
+    # enableSharedState().
+
+    def _checkBitRegister(self, register):
+        if register not in (self.REG_OUTPUT_PORT, self.REG_INVERSION, self.REG_CONFIGURATION):
+            raise ValueError("Invalid register for bit operations: %r" % (register,))
+
+    def setBits(self, mask, register=REG_OUTPUT_PORT, fresh=False):
+        """!
+        Set the bits selected by mask to 1.
+
+        @param mask: The bits to set.
+        @param register: The register to change. Defaults to the output register.
+        @param fresh: Read the register from the chip before changing it.
+
+        @return  No return value
+        """
+        self._checkBitRegister(register)
+        self._modifyRegister(register, ~mask, mask, fresh)
+
+    def clearBits(self, mask, register=REG_OUTPUT_PORT, fresh=False):
+        """!
+        Clear the bits selected by mask to 0.
+
+        @param mask: The bits to clear.
+        @param register: The register to change. Defaults to the output register.
+        @param fresh: Read the register from the chip before changing it.
+
+        @return  No return value
+        """
+        self._checkBitRegister(register)
+        self._modifyRegister(register, ~mask, 0, fresh)
+
+    def toggleBits(self, mask, register=REG_OUTPUT_PORT, fresh=False):
+        """!
+        Invert the bits selected by mask.
+
+        @param mask: The bits to invert.
+        @param register: The register to change. Defaults to the output register.
+        @param fresh: Read the register from the chip before changing it.
+
+        @return  No return value
+        """
+        self._checkBitRegister(register)
+        self._modifyRegister(register, 0xFF, mask, fresh)
+
+    def writeMasked(self, value, mask, register=REG_OUTPUT_PORT, fresh=False):
+        """!
+        Replace the bits selected by mask with the matching bits of value.
+
+        @param value: The new bit values. Bits outside mask are ignored.
+        @param mask: The bits to change.
+        @param register: The register to change. Defaults to the output register.
+        @param fresh: Read the register from the chip before changing it.
+
+        @return  No return value
+        """
+        self._checkBitRegister(register)
+        self._modifyRegister(register, ~mask, value & mask, fresh)
+
+    #----------------------------------------------------------------
+    # snapshot()
+    #
+    # Read every register of the device at once.
+
+    def snapshot(self):
+        """!
+        Read the input, output, inversion and configuration registers and refresh all
+        cached pin values. When the I2C driver and chip support auto-incrementing block
+        reads this is a single bus transaction, otherwise each register is read on its
+        own. Block reads are only used if burst_read is set to True, or to None to have
+        the next snapshot() check whether the chip supports them.
+
+        Registers with a write pending inside a batch() block keep their cached value,
+        so the pending write is not lost.
+
+        @return **GPIOSnapshot** The four register values read from the chip.
+        """
+        lock = self._sharedState
+        if lock == None:
+            lock = self._lock
+        if lock != None:
+            lock.acquire()
+
+        try:
+            data = None
+
+            if self.burst_read != False:
+                data = self._readBurst()
+
+            if data is None:
+                data = [self._i2c.readByte(self.address, register) for register in range(4)]
+
+            data = [value & 0xFF for value in data]
+
+            for register in range(4):
+                if self._dirty & (1 << register):
+                    self._chip[register] = data[register]
+                    self._known[0] |= 1 << register
+                else:
+                    self._storeRegister(register, data[register])
+        finally:
+            if lock != None:
+                lock.release()
+
+        if self.verification != None:
+            self.verification._afterAccess(self, False)
+
+        return GPIOSnapshot(*data)
+
+    def _readBurst(self):
+        """!
+        Read registers 0x00 through 0x03 with one block read.
+
+        @return **list** The four register values, or None if block reads are not usable.
         """
-        self.getGPIO()
-        return self.in_statuses
\ No newline at end of file
+        try:
+            data = self._i2c.readBlock(self.address, self.REG_INPUT_PORT, 4)
+        except (AttributeError, OSError):
+            self.burst_read = False
+            return None
+
+        if data is None or len(data) != 4:
+            self.burst_read = False
+            return None
+
+        # Not every chip auto-increments the register pointer. The output, inversion
+        # and configuration registers do not change on their own, so compare them
+        # once against single reads before trusting block reads. A chip that does not
+        # auto-increment returns the input register four times, so the check says
+        # nothing when all four bytes are equal; leave it for a later snapshot().
+        if self.burst_read is None:
+            if data[1] == data[0] and data[2] == data[0] and data[3] == data[0]:
+                return None
+
+            for register in (self.REG_OUTPUT_PORT, self.REG_INVERSION, self.REG_CONFIGURATION):
+                if self._i2c.readByte(self.address, register) != data[register]:
+                    self.burst_read = False
+                    return None
+
+            self.burst_read = True
+
+        return data
+
+    #----------------------------------------------------------------
+    # Input change callbacks
+    #
+    # Every read of the input register is compared with the previous one, and pins
+    # that changed call their attached callback. Reads can come from the user's own
+    # digitalRead() calls, or from the interrupt watcher below, which only reads the
+    # input register when the board's INT line fires.
+
+    def attachInterrupt(self, pin, callback, edge=CHANGE):
+        """!
+        Call a function when the input value of a pin changes.
+
+        @param pin: The pin number to watch.
+        @param callback: Called as callback(pin, value) with the new pin value.
+        @param edge: RISING, FALLING or CHANGE (both edges).
+
+        @return  No return value
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        if edge != self.RISING and edge != self.FALLING and edge != self.CHANGE:
+            return
+
+        if self._pinCallbacks == None:
+            self._pinCallbacks = [None] * self.NUM_GPIO
+
+        self._pinCallbacks[pin] = (edge, callback)
+
+    def detachInterrupt(self, pin):
+        """!
+        Stop calling the function attached to a pin.
+
+        @param pin: The pin number to stop watching.
+
+        @return  No return value
+        """
+        if pin < 0 or pin > 7 or self._pinCallbacks == None:
+            return
+
+        self._pinCallbacks[pin] = None
+
+    def serviceInterrupt(self):
+        """!
+        Read the input register and call the callbacks of any pins that changed. Call
+        this when the board's INT line is asserted; reading the input register also
+        releases INT.
+
+        @return **8 bit unsigned integer** The value of the input register.
+        """
+        return self.getGPIO()
+
+    def addInputListener(self, listener):
+        """!
+        Call a function with every byte read from the input register, whichever
+        method read it.
+
+        @param listener: Called as listener(value) with the input byte.
+
+        @return  No return value
+        """
+        self._inputListeners = self._inputListeners + (listener,)
+
+    def removeInputListener(self, listener):
+        """!
+        Stop calling a function passed to addInputListener().
+
+        @param listener: The function to remove.
+
+        @return  No return value
+        """
+        self._inputListeners = tuple(entry for entry in self._inputListeners if entry != listener)
+
+    #----------------------------------------------------------------
+    # Instrumentation
+    #
+    # When enabled, the driver object is wrapped so every transaction is timed and
+    # counted. When disabled the wrapper is removed, so there is no overhead at all.
+
+    def enableInstrumentation(self, historySize=64, hook=None):
+        """!
+        Start collecting statistics for every I2C transaction of this device.
+
+        @param historySize: The number of recent transactions to keep.
+        @param hook: Optional function called with each TransactionRecord, for
+                    example to export metrics.
+
+        @return **QwiicGPIOInstrumentation** The statistics object, also available as
+                self.instrumentation.
+        """
+        self.disableInstrumentation()
+        self.instrumentation = QwiicGPIOInstrumentation(historySize, hook)
+        self._i2c = _InstrumentedDriver(self._i2c, self.instrumentation)
+
+        return self.instrumentation
+
+    def disableInstrumentation(self):
+        """!
+        Stop collecting transaction statistics. The last statistics object stays
+        available as self.instrumentation until instrumentation is enabled again.
+
+        @return  No return value
+        """
+        self._removeDriverWrapper(_InstrumentedDriver)
+
+    def _removeDriverWrapper(self, wrapperClass):
+        """!
+        Remove a driver wrapper (instrumentation, retry policy) from the chain of
+        wrappers around the I2C driver, wherever it is in the chain.
+
+        @param wrapperClass: The _DriverWrapper subclass to remove.
+
+        @return  No return value
+        """
+        outer = None
+        driver = self._i2c
+
+        while isinstance(driver, _DriverWrapper):
+            if isinstance(driver, wrapperClass):
+                if outer == None:
+                    self._i2c = driver._driver
+                else:
+                    outer._driver = driver._driver
+                return
+
+            outer = driver
+            driver = driver._driver
+
+    #----------------------------------------------------------------
+    # Bus error handling
+    #
+    # A retry policy wraps the driver like instrumentation does, so a device without one
+    # has no extra overhead.
+
+    def setRetryPolicy(self, policy):
+        """!
+        Retry failed bus transactions and stop talking to a failing device for a while,
+        as set by a QwiicGPIORetryPolicy. After the device recovers, the cached register
+        values are checked against the chip with verifyState().
+
+        @param policy: The QwiicGPIORetryPolicy to use, or None to remove the current one.
+                    One policy can be shared by several devices.
+
+        @return  No return value
+        """
+        self._removeDriverWrapper(_RetryingDriver)
+
+        if policy != None:
+            self._i2c = _RetryingDriver(self._i2c, policy, self)
+
+    def enableVerification(self, everyWrites=1, interval=None):
+        """!
+        Check now and then that the chip still holds the cached configuration, and
+        re-apply it if not. A brown-out resets the chip to all inputs while the cache
+        still shows the old setup; this mode detects that and restores it.
+
+        A check reads one register, chosen so that it differs from the chip's power-up
+        value; only if it does not match the cache are all registers verified and
+        rewritten with verifyState().
+
+        @param everyWrites: Check after every this many register writes, counting writes
+                    skipped because the cache already matched. 0 disables
+                    write-triggered checks.
+        @param interval: Also check when this many seconds have passed since the last
+                    check, tested on every register read or write. None disables
+                    time-triggered checks.
+
+        @return **QwiicGPIOVerification** The settings and counters, also available as
+                self.verification.
+        """
+        self.verification = QwiicGPIOVerification(everyWrites, interval)
+        return self.verification
+
+    def disableVerification(self):
+        """!
+        Stop checking the chip for resets.
+
+        @return  No return value
+        """
+        self.verification = None
+
+    def checkState(self):
+        """!
+        Check with a single register read whether the chip has lost its cached
+        configuration, and re-apply it with verifyState() if so.
+
+        @return **8 bit unsigned integer** Bit n is set for each register n that was rewritten.
+        """
+        # A register whose last write failed may be out of step whatever the others say
+        if self._failed:
+            return self.verifyState()
+
+        # Power-up values of the chip. The first known register whose cached value
+        # differs from its power-up value shows whether the chip has been reset.
+        for register, powerUp in ((self.REG_CONFIGURATION, 0xFF), (self.REG_INVERSION, 0x00),
+                                  (self.REG_OUTPUT_PORT, 0xFF)):
+            if self._known[0] & (1 << register) and self._chip[register] != powerUp:
+                if self._i2c.readByte(self.address, register) & 0xFF == self._chip[register]:
+                    return 0
+                return self.verifyState()
+
+        return 0
+
+    def verifyState(self):
+        """!
+        Read the output, inversion and configuration registers and rewrite any that do
+        not hold the cached value, for example after the chip was reset by a brown-out.
+        Registers whose value has never been set or read are left alone, but registers
+        whose last write failed are always checked.
+
+        @return **8 bit unsigned integer** Bit n is set for each register n that was rewritten.
+        """
+        rewritten = 0
+
+        for register in (self.REG_OUTPUT_PORT, self.REG_INVERSION, self.REG_CONFIGURATION):
+            bit = 1 << register
+            if not (self._known[0] | self._failed) & bit:
+                continue
+
+            expected = self._shadow[register]
+            if self._i2c.readByte(self.address, register) & 0xFF != expected:
+                self._known[0] &= ~bit
+                self._writeRegister(register, expected)
+                rewritten |= bit
+
+        return rewritten
+
+    def _inputChanged(self, previous, value):
+        """!
+        Call the pin callbacks for the bits that differ between two input bytes.
+
+        @param previous: The previous input byte.
+        @param value: The new input byte.
+
+        @return  No return value
+        """
+        if self._pinCallbacks == None:
+            return
+
+        changed = previous ^ value
+        rising = changed & value
+
+        for pin in range(self.NUM_GPIO):
+            entry = self._pinCallbacks[pin]
+            if entry == None or not changed & (1 << pin):
+                continue
+
+            edge = self.RISING if rising & (1 << pin) else self.FALLING
+            if entry[0] & edge:
+                entry[1](pin, (value >> pin) & 1)
+
+    def startInterruptWatcher(self, source, timeout=0.1):
+        """!
+        Start a background thread that services the board whenever its INT line fires.
+        The input register is only read after an interrupt, so an idle board causes no
+        bus traffic.
+
+        source is one of:
+          - a file descriptor, or an object with fileno(), that becomes readable when
+            INT is asserted, such as a Linux gpiochip line event file descriptor.
+            Pending events are read and discarded.
+          - a callable, called as source(timeout), that waits up to timeout seconds
+            and returns True if INT was asserted. For example, with a libgpiod
+            request: lambda t: request.wait_edge_events(t) and request.read_edge_events()
+
+        @param source: The host-side INT line source.
+        @param timeout: Longest wait, in seconds, before the thread checks for a stop request.
+
+        @return  No return value
+        """
+        if threading == None:
+            raise RuntimeError("The interrupt watcher requires the threading module")
+
+        self.stopInterruptWatcher()
+
+        # The watcher updates the register cache from its own thread
+        self._getLock()
+        self._interruptWatcher = _InterruptWatcher(self, source, timeout)
+        self._interruptWatcher.start()
+
+    def stopInterruptWatcher(self):
+        """!
+        Stop the thread started by startInterruptWatcher(), if it is running.
+
+        @return  No return value
+        """
+        watcher = self._interruptWatcher
+        self._interruptWatcher = None
+
+        if watcher != None:
+            watcher.stop()
+
+# Background thread used by QwiicGPIO.startInterruptWatcher()
+
+class _InterruptWatcher(object):
+    """!
+    Waits on a host-side INT line and services a QwiicGPIO when it fires.
+
+    @param device: The QwiicGPIO object to service.
+    @param source: A file descriptor, an object with fileno(), or a wait callable.
+    @param timeout: Longest wait, in seconds, between checks for a stop request.
+    """
+    def __init__(self, device, source, timeout):
+        self._device = device
+        self._timeout = timeout
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="QwiicGPIO-INT")
+        self._thread.daemon = True
+
+        # Errors while servicing the board, from the bus or from a pin callback, are
+        # counted rather than ending the thread. lastError is the most recent one.
+        self.errorCount = 0
+        self.lastError = None
+
+        if callable(source):
+            self._wait = source
+        else:
+            self._fd = source if isinstance(source, int) else source.fileno()
+            self._wait = self._waitFd
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopEvent.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _waitFd(self, timeout):
+        """!
+        Wait for the INT file descriptor to become readable and drain its events.
+
+        @param timeout: Longest wait, in seconds.
+
+        @return **bool** True if INT fired.
+        """
+        import os
+        import select
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+
+        try:
+            os.read(self._fd, 4096)
+        except OSError:
+            pass
+
+        return True
+
+    def _run(self):
+        # Read once up front so that later changes have a reference value. This also
+        # releases INT if it was already asserted.
+        fired = True
+
+        while not self._stopEvent.is_set():
+            if fired:
+                try:
+                    self._device.serviceInterrupt()
+                except Exception as error:
+                    self.errorCount += 1
+                    self.lastError = error
+
+            fired = self._wait(self._timeout)
+
+# One I2C transaction as recorded by QwiicGPIOInstrumentation. operation is the driver
+# method name ("readByte", "writeByte", ...), value is the byte or list transferred
+# (None if the transaction failed), duration is in seconds and error is the exception
+# raised, or None.
+TransactionRecord = namedtuple("TransactionRecord",
+                               ["timestamp", "address", "operation", "register", "value", "duration", "error"])
+
+# Transaction statistics collected by QwiicGPIO.enableInstrumentation()
+
+class QwiicGPIOInstrumentation(object):
+    """!
+    QwiicGPIOInstrumentation
+
+    @param historySize: The number of recent transactions to keep.
+    @param hook: Optional function called with each TransactionRecord.
+
+    @return **Object** The statistics object.
+    """
+
+    # Constructor
+    def __init__(self, historySize=64, hook=None):
+        self.hook = hook
+        self._history = [None] * historySize
+        self.reset()
+
+    def reset(self):
+        """!
+        Clear all counters and the transaction history.
+
+        @return  No return value
+        """
+        self.transactionCount = 0
+        self.errorCount = 0
+        self.busTime = 0.0
+
+        # Counts keyed by register address and by driver method name
+        self.registerCounts = {}
+        self.registerErrors = {}
+        self.registerTime = {}
+        self.operationCounts = {}
+
+        for i in range(len(self._history)):
+            self._history[i] = None
+        self._historyIndex = 0
+
+    def record(self, address, operation, register, value, duration, error):
+        """!
+        Add one transaction. Called by the instrumented driver.
+
+        @return  No return value
+        """
+        self.transactionCount += 1
+        self.busTime += duration
+        self.registerCounts[register] = self.registerCounts.get(register, 0) + 1
+        self.registerTime[register] = self.registerTime.get(register, 0.0) + duration
+        self.operationCounts[operation] = self.operationCounts.get(operation, 0) + 1
+
+        if error != None:
+            self.errorCount += 1
+            self.registerErrors[register] = self.registerErrors.get(register, 0) + 1
+
+        entry = TransactionRecord(time.monotonic(), address, operation, register, value, duration, error)
+
+        if self._history:
+            self._history[self._historyIndex] = entry
+            self._historyIndex = (self._historyIndex + 1) % len(self._history)
+
+        if self.hook != None:
+            self.hook(entry)
+
+    def recent(self):
+        """!
+        Get the most recent transactions, oldest first.
+
+        @return **list** TransactionRecord tuples.
+        """
+        index = self._historyIndex
+        ordered = self._history[index:] + self._history[:index]
+
+        return [entry for entry in ordered if entry != None]
+
+# Base class of the objects QwiicGPIO wraps around its I2C driver. Anything not
+# overridden is passed through to the wrapped driver.
+
+class _DriverWrapper(object):
+    def __init__(self, driver):
+        self._driver = driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+# Driver wrapper installed by QwiicGPIO.enableInstrumentation()
+
+class _InstrumentedDriver(_DriverWrapper):
+    """!
+    Wraps an I2C driver object and reports every transaction to a
+    QwiicGPIOInstrumentation object.
+
+    @param driver: The I2C driver object to wrap.
+    @param stats: The QwiicGPIOInstrumentation object to report to.
+    """
+    def __init__(self, driver, stats):
+        _DriverWrapper.__init__(self, driver)
+        self._stats = stats
+
+    def _call(self, operation, address, register, args, written):
+        method = getattr(self._driver, operation)
+        start = time.perf_counter()
+
+        try:
+            result = method(address, register, *args)
+        except Exception as error:
+            self._stats.record(address, operation, register, None, time.perf_counter() - start, error)
+            raise
+
+        duration = time.perf_counter() - start
+        self._stats.record(address, operation, register, result if written == None else written, duration, None)
+
+        return result
+
+    def readByte(self, address, commandCode=None):
+        return self._call("readByte", address, commandCode, (), None)
+
+    def writeByte(self, address, commandCode, value):
+        return self._call("writeByte", address, commandCode, (value,), value)
+
+    def readBlock(self, address, commandCode, nBytes):
+        return self._call("readBlock", address, commandCode, (nBytes,), None)
+
+    def writeBlock(self, address, commandCode, value):
+        return self._call("writeBlock", address, commandCode, (value,), value)
+
+# Shared memory register cache used by QwiicGPIO.enableSharedState(). The block holds
+# the shadow bytes, the chip bytes and the known flags (9 bytes). A lock file next to
+# it, locked with flock(), serializes access between processes, and a re-entrant
+# thread lock does the same between threads of one process.
+#
+# Every process using the block holds a shared flock() on a second "users" file. The
+# kernel drops it when the process exits, even if it crashes, so whoever can lock that
+# file exclusively knows nobody else is attached: on attach the old block is stale and
+# is reset, and on detach the block and both files are removed.
+
+class _SharedRegisterState(object):
+    """!
+    A named shared memory block holding a QwiicGPIO register cache.
+
+    @param name: The name of the shared block.
+    @param shadow: The current shadow bytes, used if the block is new.
+    @param chip: The current chip bytes, used if the block is new.
+    @param known: The current known flags, used if the block is new.
+    """
+    _SIZE = 9
+
+    def __init__(self, name, shadow, chip, known):
+        import fcntl
+        import os
+        import tempfile
+        from multiprocessing import shared_memory
+
+        self._fcntl = fcntl
+        self._os = os
+        self._threadLock = threading.RLock()
+        self._depth = 0
+        self._lockPath = os.path.join(tempfile.gettempdir(), name + ".lock")
+        self._usersPath = os.path.join(tempfile.gettempdir(), name + ".users")
+        self._lockFd = self._openFile(self._lockPath)
+
+        with self:
+            # Only ever opened, locked and removed while holding the main lock
+            self._usersFd = self._openFile(self._usersPath)
+            alone = self._lockUsers(fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(self._usersFd, fcntl.LOCK_SH)
+
+            try:
+                self._memory = self._openMemory(shared_memory, name, True)
+                created = True
+            except FileExistsError:
+                self._memory = self._openMemory(shared_memory, name, False)
+                # Left behind by processes that have all gone
+                created = alone
+
+            buffer = self._memory.buf
+            self.shadow = buffer[0:4]
+            self.chip = buffer[4:8]
+            self.known = buffer[8:9]
+
+            if created:
+                self.shadow[:] = shadow
+                self.chip[:] = chip
+                self.known[:] = known
+
+    def _openMemory(self, shared_memory, name, create):
+        """!
+        Open the shared block without letting Python's resource tracker delete it when
+        this process exits, since other processes may still be using it.
+        """
+        self._tracked = False
+        try:
+            return shared_memory.SharedMemory(name, create, self._SIZE, track=False)
+        except TypeError:
+            # Python before 3.13 has no track argument
+            memory = shared_memory.SharedMemory(name, create, self._SIZE)
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(memory._name, "shared_memory")
+            except Exception:
+                self._tracked = True
+            return memory
+
+    def _openFile(self, path):
+        # Never follow a symlink planted at the predictable path
+        return self._os.open(path, self._os.O_RDWR | self._os.O_CREAT | getattr(self._os, "O_NOFOLLOW", 0),
+                             0o600)
+
+    def _lockUsers(self, operation):
+        """!
+        Try to take a non-blocking flock() on the users file.
+
+        @return **bool** True if the lock was taken.
+        """
+        try:
+            self._fcntl.flock(self._usersFd, operation)
+        except (BlockingIOError, PermissionError):
+            return False
+        return True
+
+    def _unlinkMemory(self):
+        # Before Python 3.13 unlink() also removes the name from the resource tracker,
+        # so it has to be registered again if _openMemory() removed it
+        registered = False
+        if not self._tracked and getattr(self._memory, "_track", True):
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.register(self._memory._name, "shared_memory")
+                registered = True
+            except Exception:
+                pass
+
+        try:
+            self._memory.unlink()
+        except FileNotFoundError:
+            # Already removed with disableSharedState(unlink=True)
+            if registered:
+                resource_tracker.unregister(self._memory._name, "shared_memory")
+
+    def acquire(self):
+        self._threadLock.acquire()
+        if self._depth == 0:
+            os = self._os
+            while True:
+                self._fcntl.flock(self._lockFd, self._fcntl.LOCK_EX)
+
+                # The last user removes the lock file. If that happened while we
+                # waited, we hold a lock nobody else will see; open the new file.
+                try:
+                    if os.stat(self._lockPath).st_ino == os.fstat(self._lockFd).st_ino:
+                        break
+                except FileNotFoundError:
+                    pass
+
+                os.close(self._lockFd)
+                self._lockFd = self._openFile(self._lockPath)
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            self._fcntl.flock(self._lockFd, self._fcntl.LOCK_UN)
+        self._threadLock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.release()
+        return False
+
+    def close(self, unlink=False):
+        """!
+        Detach from the shared block, removing it if this is the last user.
+
+        @param unlink: Remove the block even if other processes still use it.
+        """
+        with self:
+            self.shadow.release()
+            self.chip.release()
+            self.known.release()
+
+            last = self._lockUsers(self._fcntl.LOCK_EX | self._fcntl.LOCK_NB)
+            if unlink or last:
+                self._unlinkMemory()
+
+            if last:
+                # Removed while the main lock is held; see acquire()
+                for path in (self._usersPath, self._lockPath):
+                    try:
+                        self._os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+
+            self._memory.close()
+            self._os.close(self._usersFd)
+
+        self._os.close(self._lockFd)
+
+# Settings and counters for QwiicGPIO.enableVerification()
+
+class QwiicGPIOVerification(object):
+    """!
+    QwiicGPIOVerification
+
+    @param everyWrites: Check after every this many register writes, or 0.
+    @param interval: Check when this many seconds have passed since the last check, or None.
+
+    @return **Object** The verification object.
+    """
+
+    # Constructor
+    def __init__(self, everyWrites=1, interval=None):
+        self.everyWrites = everyWrites
+        self.interval = interval
+
+        # Checks made, checks that found the chip diverged, and registers rewritten
+        self.checkCount = 0
+        self.divergenceCount = 0
+        self.rewriteCount = 0
+
+        self._writes = 0
+        self._lastCheck = time.monotonic()
+        self._active = False
+
+    def _afterAccess(self, device, wrote):
+        """!
+        Decide whether a register access should be followed by a check, and run it.
+        """
+        if self._active:
+            return
+
+        due = False
+        if wrote and self.everyWrites:
+            self._writes += 1
+            due = self._writes >= self.everyWrites
+
+        if self.interval != None and time.monotonic() - self._lastCheck >= self.interval:
+            due = True
+
+        if not due:
+            return
+
+        self._active = True
+        try:
+            self._writes = 0
+            self._lastCheck = time.monotonic()
+            self.checkCount += 1
+
+            rewritten = device.checkState()
+            if rewritten:
+                self.divergenceCount += 1
+                while rewritten:
+                    self.rewriteCount += rewritten & 1
+                    rewritten >>= 1
+        finally:
+            self._active = False
+
+# Retry, backoff and circuit breaker settings for QwiicGPIO.setRetryPolicy(). A failed
+# transaction is retried with exponentially growing delays. After failureThreshold
+# consecutive failed operations on an address, its circuit opens: calls fail at once
+# without touching the bus until resetTimeout has passed, then one trial call is let
+# through and a success closes the circuit again.
+
+class QwiicGPIORetryPolicy(object):
+    """!
+    QwiicGPIORetryPolicy
+
+    @param retries: The number of extra attempts after a failed transaction.
+    @param backoff: The delay before the first retry, in seconds.
+    @param backoffFactor: The factor the delay grows by for each further retry.
+    @param maxBackoff: The longest delay between retries, in seconds.
+    @param failureThreshold: Consecutive failed operations that open an address's
+                    circuit. 0 disables the circuit breaker.
+    @param resetTimeout: Seconds an open circuit waits before letting a trial call through.
+
+    @return **Object** The policy object.
+    """
+
+    # Constructor
+    def __init__(self, retries=3, backoff=0.001, backoffFactor=2.0, maxBackoff=0.1,
+                 failureThreshold=5, resetTimeout=1.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.backoffFactor = backoffFactor
+        self.maxBackoff = maxBackoff
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+
+        # Per address: [consecutive failures, time the circuit opened or None]
+        self._circuits = {}
+
+        self.resetStatistics()
+
+    def resetStatistics(self):
+        """!
+        Set all counters back to zero.
+
+        @return  No return value
+        """
+        # Operations attempted, retries made, operations that failed after all
+        # retries, calls rejected by an open circuit, circuit openings and recoveries
+        self.operationCount = 0
+        self.retryCount = 0
+        self.failureCount = 0
+        self.rejectedCount = 0
+        self.tripCount = 0
+        self.recoveryCount = 0
+
+    def isOpen(self, address):
+        """!
+        Determine if the circuit for an address is open, so calls fail without
+        touching the bus.
+
+        @param address: The I2C address.
+
+        @return **bool** True if the circuit is open, otherwise False.
+        """
+        circuit = self._circuits.get(address)
+        return circuit != None and circuit[1] != None
+
+    def call(self, address, method, *args):
+        """!
+        Run a driver call under this policy.
+
+        @param address: The I2C address the call talks to.
+        @param method: The driver method.
+        @param args: Arguments for the method.
+
+        @return **tuple** The method's return value, and True if the call closed a
+                previously open circuit.
+        """
+        circuit = self._circuits.get(address)
+        if circuit == None:
+            circuit = [0, None]
+            self._circuits[address] = circuit
+
+        if circuit[1] != None and time.monotonic() - circuit[1] < self.resetTimeout:
+            self.rejectedCount += 1
+            raise OSError("I2C device 0x%02X is not responding; retrying later" % address)
+
+        trial = circuit[1] != None
+        attempts = 1 if trial else self.retries + 1
+        delay = self.backoff
+
+        self.operationCount += 1
+
+        for attempt in range(attempts):
+            if attempt:
+                self.retryCount += 1
+                time.sleep(delay)
+                delay = min(delay * self.backoffFactor, self.maxBackoff)
+
+            try:
+                result = method(*args)
+            except OSError as error:
+                lastError = error
+                continue
+
+            circuit[0] = 0
+            if trial:
+                circuit[1] = None
+                self.recoveryCount += 1
+
+            return result, trial
+
+        self.failureCount += 1
+        circuit[0] += 1
+
+        if trial or (self.failureThreshold and circuit[0] >= self.failureThreshold):
+            if not trial:
+                self.tripCount += 1
+            circuit[1] = time.monotonic()
+
+        raise lastError
+
+# Driver wrapper installed by QwiicGPIO.setRetryPolicy()
+
+class _RetryingDriver(_DriverWrapper):
+    """!
+    Wraps an I2C driver object and runs every transaction under a QwiicGPIORetryPolicy.
+
+    @param driver: The I2C driver object to wrap.
+    @param policy: The QwiicGPIORetryPolicy to apply.
+    @param device: The QwiicGPIO object to verify after a recovery.
+    """
+    def __init__(self, driver, policy, device):
+        _DriverWrapper.__init__(self, driver)
+        self.policy = policy
+        self._device = device
+        self._verifying = False
+
+    def _call(self, operation, address, *args):
+        result, recovered = self.policy.call(address, getattr(self._driver, operation), address, *args)
+
+        # The chip may have lost its state while it was unreachable
+        if recovered and not self._verifying and address == self._device.address:
+            self._verifying = True
+            try:
+                self._device.verifyState()
+            finally:
+                self._verifying = False
+
+        return result
+
+    def readByte(self, address, commandCode=None):
+        return self._call("readByte", address, commandCode)
+
+    def writeByte(self, address, commandCode, value):
+        return self._call("writeByte", address, commandCode, value)
+
+    def readBlock(self, address, commandCode, nBytes):
+        return self._call("readBlock", address, commandCode, nBytes)
+
+    def writeBlock(self, address, commandCode, value):
+        return self._call("writeBlock", address, commandCode, value)
+
+# Background input sampling for boards without a wired INT line. Samples are taken on
+# fixed absolute deadlines so timing does not drift, and only pins that changed since
+# the previous sample produce events.
+
+class QwiicGPIOPoller(object):
+    """!
+    QwiicGPIOPoller
+
+    @param device: The QwiicGPIO object to sample.
+    @param rate: Target number of samples per second.
+    @param queue: Optional queue.Queue (or any object with put()) that receives a
+                (timestamp, pin, value) tuple for every edge.
+
+    @return **Object** The poller object. Call start() to begin sampling.
+    """
+
+    # Constructor
+    def __init__(self, device, rate=100.0, queue=None):
+        self.device = device
+        self.rate = rate
+        self.queue = queue
+
+        self._subscribers = []
+        self._thread = None
+        self._stopEvent = None
+
+        # Statistics. missedDeadlines counts samples that started after the next
+        # sample was already due; those sample slots are skipped rather than bunched.
+        self.sampleCount = 0
+        self.missedDeadlines = 0
+
+        # Errors from the bus, queue or subscribers are counted rather than ending the
+        # thread. lastError is the most recent one.
+        self.errorCount = 0
+        self.lastError = None
+
+    def subscribe(self, callback, mask=0xFF, edge=QwiicGPIO.CHANGE):
+        """!
+        Call a function for edges on the selected pins. Callbacks run on the poller thread.
+
+        @param callback: Called as callback(timestamp, pin, value). timestamp is from
+                        time.monotonic() and value is the new pin value.
+        @param mask: The pins to report. Defaults to all 8 pins.
+        @param edge: QwiicGPIO.RISING, QwiicGPIO.FALLING or QwiicGPIO.CHANGE.
+
+        @return  No return value
+        """
+        self._subscribers.append((mask & 0xFF, edge, callback))
+
+    def unsubscribe(self, callback):
+        """!
+        Stop calling a function passed to subscribe().
+
+        @param callback: The function to remove.
+
+        @return  No return value
+        """
+        self._subscribers = [entry for entry in self._subscribers if entry[2] != callback]
+
+    def isRunning(self):
+        """!
+        Determine if the poller thread is running.
+
+        @return **bool** True if sampling is active, otherwise False.
+        """
+        return self._thread != None and self._thread.is_alive()
+
+    def start(self):
+        """!
+        Start sampling on a background thread.
+
+        @return  No return value
+        """
+        if threading == None:
+            raise RuntimeError("The poller requires the threading module")
+
+        if self.isRunning():
+            return
+
+        # The poller updates the register cache from its own thread
+        self.device._getLock()
+
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="QwiicGPIO-poll")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """!
+        Stop sampling and wait for the thread to finish.
+
+        @return  No return value
+        """
+        if self._thread == None:
+            return
+
+        self._stopEvent.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _emit(self, timestamp, previous, value):
+        """!
+        Send the edges between two input bytes to the queue and subscribers.
+
+        @param timestamp: When value was sampled.
+        @param previous: The previous input byte.
+        @param value: The new input byte.
+
+        @return  No return value
+        """
+        changed = previous ^ value
+        rising = changed & value
+
+        for pin in range(QwiicGPIO.NUM_GPIO):
+            bit = 1 << pin
+            if not changed & bit:
+                continue
+
+            pinValue = 1 if rising & bit else 0
+            edge = QwiicGPIO.RISING if pinValue else QwiicGPIO.FALLING
+
+            if self.queue != None:
+                self.queue.put((timestamp, pin, pinValue))
+
+            for mask, wanted, callback in self._subscribers:
+                if mask & bit and wanted & edge:
+                    callback(timestamp, pin, pinValue)
+
+    def _run(self):
+        period = 1.0 / self.rate
+        previous = None
+        deadline = time.monotonic()
+
+        while not self._stopEvent.is_set():
+            try:
+                value = self.device.getGPIO()
+            except Exception as error:
+                self.errorCount += 1
+                self.lastError = error
+                value = previous
+
+            timestamp = time.monotonic()
+            self.sampleCount += 1
+
+            if previous != None and value != previous:
+                try:
+                    self._emit(timestamp, previous, value)
+                except Exception as error:
+                    self.errorCount += 1
+                    self.lastError = error
+            previous = value
+
+            deadline += period
+            now = time.monotonic()
+            if now >= deadline:
+                # Late: count the slots we missed and resynchronise to the next one
+                missed = int((now - deadline) / period) + 1
+                self.missedDeadlines += missed
+                deadline += missed * period
+
+            self._stopEvent.wait(deadline - time.monotonic())
+
+def _sleepUntil(stopEvent, deadline, spin):
+    """!
+    Wait until time.monotonic() reaches deadline, sleeping until spin seconds before it
+    and busy-waiting for the rest to reduce jitter.
+
+    @param stopEvent: A threading.Event that cancels the wait when set.
+    @param deadline: The time.monotonic() value to wait for.
+    @param spin: Seconds to busy-wait before the deadline.
+
+    @return **bool** False if the wait was cancelled.
+    """
+    remaining = deadline - time.monotonic() - spin
+    if remaining > 0 and stopEvent.wait(remaining):
+        return False
+
+    while time.monotonic() < deadline:
+        if stopEvent.is_set():
+            return False
+
+    return not stopEvent.is_set()
+
+# Handle for one pin of a QwiicGPIO, returned by QwiicGPIO.pin(). The bit mask is
+# worked out once when the handle is created.
+
+class QwiicGPIOPin(object):
+    """!
+    QwiicGPIOPin
+
+    @param device: The QwiicGPIO object the pin belongs to.
+    @param pin: The pin number, 0 to 7. Use QwiicGPIO.pin(), which checks it.
+
+    @return **Object** The pin handle.
+    """
+    __slots__ = ("device", "pin", "mask")
+
+    # Constructor
+    def __init__(self, device, pin):
+        self.device = device
+        self.pin = pin
+        self.mask = 1 << pin
+
+    def __repr__(self):
+        return "QwiicGPIOPin(0x%02X, %d)" % (self.device.address, self.pin)
+
+    def on(self):
+        """!
+        Set the output HIGH.
+
+        @return  No return value
+        """
+        self.device._writeRegisterMask(QwiicGPIO.REG_OUTPUT_PORT, 0xFF, self.mask)
+
+    def off(self):
+        """!
+        Set the output LOW.
+
+        @return  No return value
+        """
+        self.device._writeRegisterMask(QwiicGPIO.REG_OUTPUT_PORT, 0x00, self.mask)
+
+    def toggle(self):
+        """!
+        Invert the output level.
+
+        @return  No return value
+        """
+        self.device._modifyRegister(QwiicGPIO.REG_OUTPUT_PORT, 0xFF, self.mask)
+
+    @property
+    def value(self):
+        """!
+        The input value of the pin, read from the device. Assigning sets the output level.
+        """
+        return 1 if self.device.getGPIO() & self.mask else 0
+
+    @value.setter
+    def value(self, level):
+        self.device._writeRegisterMask(QwiicGPIO.REG_OUTPUT_PORT, 0xFF if level else 0x00, self.mask)
+
+    @property
+    def output(self):
+        """!
+        The cached output level of the pin. No bus traffic is generated.
+        """
+        return 1 if self.device._shadow[QwiicGPIO.REG_OUTPUT_PORT] & self.mask else 0
+
+    @property
+    def mode(self):
+        """!
+        The cached mode of the pin, GPIO_IN or GPIO_OUT. Assigning writes it.
+        """
+        return 1 if self.device._shadow[QwiicGPIO.REG_CONFIGURATION] & self.mask else 0
+
+    @mode.setter
+    def mode(self, mode):
+        self.device._writeRegisterMask(QwiicGPIO.REG_CONFIGURATION, 0xFF if mode else 0x00, self.mask)
+
+    @property
+    def invert(self):
+        """!
+        The cached input inversion of the pin. Assigning writes it.
+        """
+        return 1 if self.device._shadow[QwiicGPIO.REG_INVERSION] & self.mask else 0
+
+    @invert.setter
+    def invert(self, invert):
+        self.device._writeRegisterMask(QwiicGPIO.REG_INVERSION, 0xFF if invert else 0x00, self.mask)
+
+# Timed playback of output patterns, such as stepper phases, LED chases or reset
+# pulses. Each step is an (output byte, duration in seconds) pair, and step n is
+# written at the start time plus the durations of all earlier steps, so timing errors
+# do not accumulate.
+
+class QwiicGPIOPattern(object):
+    """!
+    QwiicGPIOPattern
+
+    @param device: The QwiicGPIO object to drive.
+    @param steps: A sequence or iterator of (output byte, duration) pairs. Without
+                loop, playback ends as soon as the last step has been written.
+    @param loop: If True, start again from the first step after the last one.
+                Only possible when steps is a sequence.
+    @param mask: The output pins the pattern controls. Defaults to all 8 pins.
+    @param spin: Seconds before each deadline during which the thread busy-waits
+                instead of sleeping, trading CPU time for lower jitter.
+
+    @return **Object** The pattern object. Call start() to begin playback.
+    """
+
+    # Constructor
+    def __init__(self, device, steps, loop=False, mask=0xFF, spin=0.0005):
+        self.device = device
+        self.mask = mask
+        self.spin = spin
+
+        if isinstance(steps, (list, tuple)):
+            self._steps = tuple((value & 0xFF, float(duration)) for value, duration in steps)
+        else:
+            if loop:
+                raise ValueError("loop requires steps to be a sequence")
+            self._steps = steps
+
+        self.loop = loop
+        self._thread = None
+        self._stopEvent = None
+
+        # Timing statistics. Errors are how late each step's write started, in seconds.
+        self.stepCount = 0
+        self.lastError = 0.0
+        self.maxError = 0.0
+        self.totalError = 0.0
+
+        # Steps whose write raised. Playback skips them and carries on; lastException
+        # is the most recent exception, including one that ended playback early.
+        self.errorCount = 0
+        self.lastException = None
+
+    @property
+    def meanError(self):
+        """!
+        The average lateness of the writes so far, in seconds.
+        """
+        return self.totalError / self.stepCount if self.stepCount else 0.0
+
+    def isRunning(self):
+        """!
+        Determine if the pattern is playing.
+
+        @return **bool** True if playback is active, otherwise False.
+        """
+        return self._thread != None and self._thread.is_alive()
+
+    def start(self):
+        """!
+        Start playback on a background thread.
+
+        @return  No return value
+        """
+        if threading == None:
+            raise RuntimeError("Pattern playback requires the threading module")
+
+        if self.isRunning():
+            return
+
+        # Playback writes the register cache from its own thread
+        self.device._getLock()
+
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="QwiicGPIO-pattern")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """!
+        Cancel playback and wait for the thread to finish. The outputs keep the last
+        value written.
+
+        @return  No return value
+        """
+        if self._thread == None:
+            return
+
+        self._stopEvent.set()
+        self.wait()
+
+    def wait(self, timeout=None):
+        """!
+        Wait for playback to finish.
+
+        @param timeout: Longest time to wait, in seconds. Defaults to no limit.
+
+        @return **bool** True if playback has finished, otherwise False.
+        """
+        if self._thread != None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+        return not self.isRunning()
+
+    def _run(self):
+        try:
+            self._play()
+        except Exception as error:
+            # A failing steps iterator ends playback; keep the reason
+            self.lastException = error
+
+    def _play(self):
+        deadline = time.monotonic()
+
+        while True:
+            for value, duration in self._steps:
+                if not _sleepUntil(self._stopEvent, deadline, self.spin):
+                    return
+
+                error = time.monotonic() - deadline
+                try:
+                    self.device.writePortMask(value, self.mask)
+                except Exception as exception:
+                    self.errorCount += 1
+                    self.lastException = exception
+
+                self.stepCount += 1
+                self.lastError = error
+                self.totalError += error
+                if error > self.maxError:
+                    self.maxError = error
+
+                deadline += duration
+
+            if not self.loop:
+                return
+
+# Software PWM on output pins. Each PWM period is split into resolution time slots and
+# the combined output byte of every PWM pin is worked out for each slot. Only the slots
+# where that byte changes are kept, so a period costs one write per distinct duty
+# cycle edge rather than one per slot or per pin.
+
+class QwiicGPIOPWM(object):
+    """!
+    QwiicGPIOPWM
+
+    The PWM thread writes through the QwiicGPIO object under its cache lock, so other
+    output pins of the same device can still be changed from other threads. A write
+    that fails is counted in errorCount and retried at the next slot.
+
+    @param device: The QwiicGPIO object to drive. PWM pins must be configured as outputs.
+    @param frequency: The PWM base frequency in Hz.
+    @param resolution: The number of duty cycle steps per period.
+    @param spin: Seconds before each write during which the thread busy-waits
+                instead of sleeping, trading CPU time for lower jitter.
+
+    @return **Object** The PWM object. Set duty cycles, then call start().
+    """
+
+    # Constructor
+    def __init__(self, device, frequency=100.0, resolution=32, spin=0.0005):
+        self.device = device
+        self.frequency = float(frequency)
+        self.resolution = resolution
+        self.spin = spin
+
+        self._duties = [None] * QwiicGPIO.NUM_GPIO
+        self._thread = None
+        self._stopEvent = None
+        self._compile()
+
+        # The most recent exception raised by a PWM write
+        self.lastError = None
+
+        self.resetStatistics()
+
+    def resetStatistics(self):
+        """!
+        Set all statistics back to zero.
+
+        @return  No return value
+        """
+        # Periods completed, register writes made, and periods skipped because the
+        # thread fell more than a full period behind
+        self.periodCount = 0
+        self.writeCount = 0
+        self.missedPeriods = 0
+        self._statsStart = time.monotonic()
+
+        # Writes that raised; the PWM keeps running and retries at the next slot
+        self.errorCount = 0
+
+    @property
+    def achievedFrequency(self):
+        """!
+        Periods completed per second since the statistics were last reset.
+        """
+        elapsed = time.monotonic() - self._statsStart
+        return self.periodCount / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def busLoad(self):
+        """!
+        Output register writes per second since the statistics were last reset.
+        """
+        elapsed = time.monotonic() - self._statsStart
+        return self.writeCount / elapsed if elapsed > 0 else 0.0
+
+    def setDuty(self, pin, duty):
+        """!
+        Set the fraction of each period a pin is HIGH. The change takes effect at the
+        start of the next period.
+
+        @param pin: The pin number.
+        @param duty: The duty cycle from 0.0 to 1.0, or None to stop controlling the pin.
+
+        @return  No return value
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        if duty != None:
+            duty = min(max(float(duty), 0.0), 1.0)
+
+        self._duties[pin] = duty
+        self._compile()
+
+    def getDuty(self, pin):
+        """!
+        Get the duty cycle of a pin.
+
+        @param pin: The pin number.
+
+        @return **float** The duty cycle, or None if the pin is not PWM controlled.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        return self._duties[pin]
+
+    def _compile(self):
+        """!
+        Build the write schedule for one period: a mask of the PWM pins and a tuple of
+        (time offset, output byte) pairs for the slots where the output byte changes.
+        """
+        mask = 0
+        onSlots = [0] * QwiicGPIO.NUM_GPIO
+
+        for pin in range(QwiicGPIO.NUM_GPIO):
+            duty = self._duties[pin]
+            if duty != None:
+                mask |= 1 << pin
+                onSlots[pin] = int(round(duty * self.resolution))
+
+        slotBytes = []
+        for slot in range(self.resolution):
+            value = 0
+            for pin in range(QwiicGPIO.NUM_GPIO):
+                if slot < onSlots[pin]:
+                    value |= 1 << pin
+            slotBytes.append(value & mask)
+
+        slotTime = 1.0 / (self.frequency * self.resolution)
+        schedule = [(slot * slotTime, slotBytes[slot]) for slot in range(self.resolution)
+                    if slot == 0 or slotBytes[slot] != slotBytes[slot - 1]]
+
+        # Replaced in one assignment so the PWM thread never sees a half-built schedule
+        self._schedule = (mask, tuple(schedule))
+
+    def isRunning(self):
+        """!
+        Determine if the PWM thread is running.
+
+        @return **bool** True if PWM output is active, otherwise False.
+        """
+        return self._thread != None and self._thread.is_alive()
+
+    def start(self):
+        """!
+        Start PWM output on a background thread.
+
+        @return  No return value
+        """
+        if threading == None:
+            raise RuntimeError("Software PWM requires the threading module")
+
+        if self.isRunning():
+            return
+
+        self.resetStatistics()
+
+        # The PWM thread writes the register cache from its own thread
+        self.device._getLock()
+
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="QwiicGPIO-PWM")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, level=QwiicGPIO.GPIO_LO):
+        """!
+        Stop PWM output and set every PWM pin to a fixed level.
+
+        @param level: The level to leave the PWM pins at.
+
+        @return  No return value
+        """
+        if self._thread == None:
+            return
+
+        self._stopEvent.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+        mask = self._schedule[0]
+        if mask:
+            self.device.writePortMask(0xFF if level else 0x00, mask)
+
+    def _run(self):
+        period = 1.0 / self.frequency
+        periodStart = time.monotonic()
+        lastValue = None
+
+        while True:
+            mask, schedule = self._schedule
+
+            for offset, value in schedule:
+                if not _sleepUntil(self._stopEvent, periodStart + offset, self.spin):
+                    return
+
+                if value != lastValue:
+                    try:
+                        self.device.writePortMask(value, mask)
+                    except Exception as error:
+                        self.errorCount += 1
+                        self.lastError = error
+                        lastValue = None
+                        continue
+
+                    self.writeCount += 1
+                    lastValue = value
+
+            self.periodCount += 1
+            periodStart += period
+
+            now = time.monotonic()
+            if now - periodStart >= period:
+                missed = int((now - periodStart) / period)
+                self.missedPeriods += missed
+                periodStart += missed * period
+
+# Edge capture for pulse width and frequency measurement on input pins. Every input
+# byte sampled is compared with the previous one, and each transition is stored with
+# its time.monotonic() timestamp in a fixed-size ring buffer per pin. Period, pulse
+# widths and counts are updated as edges arrive, so no history needs to be kept to
+# compute them. Resolution is limited by the sampling rate.
+
+class QwiicGPIOCapture(object):
+    """!
+    QwiicGPIOCapture
+
+    @param historySize: The number of edges kept per pin.
+    @param mask: The pins to capture. Defaults to all 8 pins.
+
+    @return **Object** The capture object. Feed it with update() or attach().
+    """
+
+    # Constructor
+    def __init__(self, historySize=32, mask=0xFF):
+        self.mask = mask & 0xFF
+        self._historySize = historySize
+
+        # Per-pin ring buffers of edge times and the level each edge went to
+        self._times = [[0.0] * historySize for pin in range(QwiicGPIO.NUM_GPIO)]
+        self._levels = [bytearray(historySize) for pin in range(QwiicGPIO.NUM_GPIO)]
+
+        self._device = None
+        self.reset()
+
+    def reset(self):
+        """!
+        Forget all captured edges and statistics.
+
+        @return  No return value
+        """
+        self._previous = None
+        self._next = [0] * QwiicGPIO.NUM_GPIO
+        self._edgeCount = [0] * QwiicGPIO.NUM_GPIO
+        self._risingCount = [0] * QwiicGPIO.NUM_GPIO
+
+        # Time of the latest rising and falling edge, or None
+        self._lastRise = [None] * QwiicGPIO.NUM_GPIO
+        self._lastFall = [None] * QwiicGPIO.NUM_GPIO
+
+        # Latest complete period (rising to rising), high and low times, and the sum
+        # and count of all periods for the mean
+        self._period = [None] * QwiicGPIO.NUM_GPIO
+        self._highTime = [None] * QwiicGPIO.NUM_GPIO
+        self._lowTime = [None] * QwiicGPIO.NUM_GPIO
+        self._periodSum = [0.0] * QwiicGPIO.NUM_GPIO
+        self._periodCount = [0] * QwiicGPIO.NUM_GPIO
+
+    def attach(self, device):
+        """!
+        Capture edges from every input byte read from a QwiicGPIO, whichever method
+        reads it. Sample the device regularly, for example with a QwiicGPIOPoller.
+
+        @param device: The QwiicGPIO object to take samples from.
+
+        @return  No return value
+        """
+        self.detach()
+        self._device = device
+        device.addInputListener(self.update)
+
+    def detach(self):
+        """!
+        Stop taking samples from the device passed to attach().
+
+        @return  No return value
+        """
+        if self._device != None:
+            self._device.removeInputListener(self.update)
+            self._device = None
+
+    def update(self, sample, timestamp=None):
+        """!
+        Add one input sample.
+
+        @param sample: The input byte.
+        @param timestamp: When the sample was taken. Defaults to time.monotonic().
+
+        @return  No return value
+        """
+        previous = self._previous
+        self._previous = sample
+        if previous == None:
+            return
+
+        changed = (previous ^ sample) & self.mask
+        if not changed:
+            return
+
+        if timestamp == None:
+            timestamp = time.monotonic()
+
+        for pin in range(QwiicGPIO.NUM_GPIO):
+            bit = 1 << pin
+            if not changed & bit:
+                continue
+
+            level = 1 if sample & bit else 0
+
+            index = self._next[pin]
+            self._times[pin][index] = timestamp
+            self._levels[pin][index] = level
+            self._next[pin] = (index + 1) % self._historySize
+            self._edgeCount[pin] += 1
+
+            if level:
+                self._risingCount[pin] += 1
+                lastRise = self._lastRise[pin]
+                if lastRise != None:
+                    period = timestamp - lastRise
+                    self._period[pin] = period
+                    self._periodSum[pin] += period
+                    self._periodCount[pin] += 1
+                if self._lastFall[pin] != None:
+                    self._lowTime[pin] = timestamp - self._lastFall[pin]
+                self._lastRise[pin] = timestamp
+            else:
+                if self._lastRise[pin] != None:
+                    self._highTime[pin] = timestamp - self._lastRise[pin]
+                self._lastFall[pin] = timestamp
+
+    def edges(self, pin):
+        """!
+        Get the captured edges of a pin, oldest first.
+
+        @param pin: The pin number.
+
+        @return **list** (timestamp, level) tuples, level being the value the pin changed to.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        count = min(self._edgeCount[pin], self._historySize)
+        start = (self._next[pin] - count) % self._historySize
+        result = []
+
+        for i in range(count):
+            index = (start + i) % self._historySize
+            result.append((self._times[pin][index], self._levels[pin][index]))
+
+        return result
+
+    def edgeCount(self, pin):
+        """!
+        Get the number of edges seen on a pin since the last reset().
+
+        @param pin: The pin number.
+
+        @return **int** The edge count.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        return self._edgeCount[pin]
+
+    def pulseCount(self, pin):
+        """!
+        Get the number of rising edges seen on a pin since the last reset(), for
+        example to count tachometer or flow meter pulses.
+
+        @param pin: The pin number.
+
+        @return **int** The rising edge count.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        return self._risingCount[pin]
+
+    def period(self, pin):
+        """!
+        Get the time between the two most recent rising edges of a pin.
+
+        @param pin: The pin number.
+
+        @return **float** The period in seconds, or None until two rising edges are seen.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        return self._period[pin]
+
+    def meanPeriod(self, pin):
+        """!
+        Get the average time between rising edges of a pin since the last reset().
+
+        @param pin: The pin number.
+
+        @return **float** The mean period in seconds, or None until two rising edges are seen.
+        """
+        if pin < 0 or pin > 7 or not self._periodCount[pin]:
+            return
+
+        return self._periodSum[pin] / self._periodCount[pin]
+
+    def frequency(self, pin):
+        """!
+        Get the frequency of a pin from its latest period.
+
+        @param pin: The pin number.
+
+        @return **float** The frequency in Hz, or None until two rising edges are seen.
+        """
+        period = self.period(pin)
+        if not period:
+            return
+
+        return 1.0 / period
+
+    def pulseWidth(self, pin, level=QwiicGPIO.GPIO_HI):
+        """!
+        Get the duration of the latest complete high or low pulse of a pin.
+
+        @param pin: The pin number.
+        @param level: GPIO_HI for the high pulse width, GPIO_LO for the low one.
+
+        @return **float** The pulse width in seconds, or None if no complete pulse was seen.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        return self._highTime[pin] if level else self._lowTime[pin]
+
+    def dutyCycle(self, pin):
+        """!
+        Get the fraction of time a pin is high, from its latest high pulse and low pulse.
+
+        @param pin: The pin number.
+
+        @return **float** The duty cycle from 0.0 to 1.0, or None until a full cycle is seen.
+        """
+        if pin < 0 or pin > 7:
+            return
+
+        high = self._highTime[pin]
+        low = self._lowTime[pin]
+        if high == None or low == None or high + low <= 0:
+            return
+
+        return high / (high + low)
+
+# Software debouncing of the input byte. Each pin has a counter of consecutive samples
+# that disagree with its debounced value; once it reaches the pin's count the debounced
+# value flips. The counters are stored bit-sliced ("vertical counters"): plane n holds
+# bit n of all 8 counters, so every pin is updated with a handful of byte-wide
+# operations per sample instead of a loop over pins.
+
+class QwiicGPIODebouncer(object):
+    """!
+    QwiicGPIODebouncer
+
+    @param count: The number of consecutive samples a new pin value must hold before it
+                is accepted. Either one count for every pin or a list of 8 per-pin counts.
+                A count of 1 accepts every change immediately.
+    @param initial: The starting debounced byte. If not provided, the first sample is
+                used as is.
+
+    @return **Object** The debouncer object. Feed it with update() or attach().
+    """
+
+    # Constructor
+    def __init__(self, count=4, initial=None):
+        counts = count if isinstance(count, (list, tuple)) else [count] * QwiicGPIO.NUM_GPIO
+
+        if len(counts) != QwiicGPIO.NUM_GPIO or min(counts) < 1:
+            raise ValueError("count must be at least 1 for every pin")
+
+        # Pins sharing a count are compared against it together
+        self._groups = []
+        for value in sorted(set(counts)):
+            mask = 0
+            for pin in range(QwiicGPIO.NUM_GPIO):
+                if counts[pin] == value:
+                    mask |= 1 << pin
+            self._groups.append((mask, value))
+
+        numPlanes = 1
+        while max(counts) >> numPlanes:
+            numPlanes += 1
+        self._planes = [0] * numPlanes
+        self._state = initial
+        self._subscribers = []
+        self._device = None
+
+    @property
+    def value(self):
+        """!
+        The debounced input byte, or None before the first sample.
+        """
+        return self._state
+
+    def digitalRead(self, pin):
+        """!
+        Get the debounced value of a single pin. No bus traffic is generated.
+
+        @param pin: The pin number to get the value of.
+
+        @return **bool** The debounced value of the pin.
+        """
+        if pin < 0 or pin > 7 or self._state == None:
+            return
+
+        return (self._state >> pin) & 1
+
+    def subscribe(self, callback, mask=0xFF, edge=QwiicGPIO.CHANGE):
+        """!
+        Call a function when the debounced value of the selected pins changes.
+
+        @param callback: Called as callback(pin, value) with the new debounced value.
+        @param mask: The pins to report. Defaults to all 8 pins.
+        @param edge: QwiicGPIO.RISING, QwiicGPIO.FALLING or QwiicGPIO.CHANGE.
+
+        @return  No return value
+        """
+        self._subscribers.append((mask & 0xFF, edge, callback))
+
+    def unsubscribe(self, callback):
+        """!
+        Stop calling a function passed to subscribe().
+
+        @param callback: The function to remove.
+
+        @return  No return value
+        """
+        self._subscribers = [entry for entry in self._subscribers if entry[2] != callback]
+
+    def attach(self, device):
+        """!
+        Debounce every input byte read from a QwiicGPIO, whichever method reads it
+        (digitalRead(), a QwiicGPIOPoller, the interrupt watcher, ...). The debouncer
+        only advances when a sample is taken, so the device should be sampled
+        periodically, for example with a QwiicGPIOPoller.
+
+        @param device: The QwiicGPIO object to take samples from.
+
+        @return  No return value
+        """
+        self.detach()
+        self._device = device
+        device.addInputListener(self.update)
+
+    def detach(self):
+        """!
+        Stop taking samples from the device passed to attach().
+
+        @return  No return value
+        """
+        if self._device != None:
+            self._device.removeInputListener(self.update)
+            self._device = None
+
+    def update(self, sample):
+        """!
+        Add one input sample.
+
+        @param sample: The raw input byte.
+
+        @return **8 bit unsigned integer** The debounced input byte.
+        """
+        state = self._state
+        if state == None:
+            self._state = sample & 0xFF
+            return self._state
+
+        planes = self._planes
+
+        # Increment the counters of pins that disagree with the debounced value and
+        # clear the counters of pins that agree.
+        differ = (sample ^ state) & 0xFF
+        carry = differ
+        for n in range(len(planes)):
+            plane = planes[n]
+            planes[n] = (plane ^ carry) & differ
+            carry &= plane
+
+        # Pins whose counter has reached their count take the new value
+        accepted = 0
+        for mask, count in self._groups:
+            match = mask & differ
+            for n in range(len(planes)):
+                if count & (1 << n):
+                    match &= planes[n]
+                else:
+                    match &= ~planes[n]
+            accepted |= match
+
+        if not accepted:
+            return state
+
+        for n in range(len(planes)):
+            planes[n] &= ~accepted
+
+        self._state = state ^ accepted
+        self._emit(state, self._state)
+
+        return self._state
+
+    def _emit(self, previous, value):
+        """!
+        Call subscribers for the bits that differ between two debounced bytes.
+
+        @param previous: The previous debounced byte.
+        @param value: The new debounced byte.
+
+        @return  No return value
+        """
+        changed = previous ^ value
+
+        for pin in range(QwiicGPIO.NUM_GPIO):
+            bit = 1 << pin
+            if not changed & bit:
+                continue
+
+            pinValue = 1 if value & bit else 0
+            edge = QwiicGPIO.RISING if pinValue else QwiicGPIO.FALLING
+
+            for mask, wanted, callback in self._subscribers:
+                if mask & bit and wanted & edge:
+                    callback(pin, pinValue)
+
+# Declarative pin setup. A profile lists the mode, inversion and initial level of each
+# pin, for one board or for several boards by address:
+#
+#   {"pins": {0: {"mode": "out", "level": "high"}, 1: {"mode": "in", "invert": True}}}
+#   {"boards": {"0x27": {"pins": {...}}, "0x26": {"pins": {...}}}}
+#
+# It is compiled once into a (value, mask) pair per register and board, and applied
+# with output levels first and the configuration last, so pins only become outputs
+# once their levels are safe. Pins not listed are left as they are.
+
+# Compiled profiles, keyed by the canonical text of their specification
+_profileCache = {}
+
+class QwiicGPIOProfile(object):
+    """!
+    QwiicGPIOProfile
+
+    @param spec: The profile, as a dict or a JSON string.
+
+    @return **Object** The compiled profile.
+    """
+
+    _MODES = {"out": QwiicGPIO.GPIO_OUT, "output": QwiicGPIO.GPIO_OUT,
+              "in": QwiicGPIO.GPIO_IN, "input": QwiicGPIO.GPIO_IN}
+    _LEVELS = {"low": QwiicGPIO.GPIO_LO, "high": QwiicGPIO.GPIO_HI}
+
+    # Constructor
+    def __init__(self, spec):
+        if isinstance(spec, str):
+            import json
+            spec = json.loads(spec)
+
+        # address (None for a single-board profile) -> (output, inversion, configuration),
+        # each a (value, mask) pair
+        self.boards = {}
+
+        if "boards" in spec:
+            for address, board in spec["boards"].items():
+                if isinstance(address, str):
+                    address = int(address, 0)
+                self.boards[address] = self._compileBoard(board)
+        else:
+            address = spec.get("address")
+            if isinstance(address, str):
+                address = int(address, 0)
+            self.boards[address] = self._compileBoard(spec)
+
+    @classmethod
+    def load(cls, spec):
+        """!
+        Get the compiled profile for a specification, compiling it only the first time.
+
+        @param spec: The profile, as a dict or a JSON string.
+
+        @return **QwiicGPIOProfile** The compiled profile.
+        """
+        if isinstance(spec, str):
+            key = spec
+        else:
+            import json
+            key = json.dumps(spec, sort_keys=True)
+
+        profile = _profileCache.get(key)
+        if profile == None:
+            profile = cls(spec)
+            _profileCache[key] = profile
+
+        return profile
+
+    def _compileBoard(self, board):
+        """!
+        Compile the pins of one board.
+
+        @param board: A dict with a "pins" entry.
+
+        @return **tuple** (value, mask) pairs for the output, inversion and
+                configuration registers.
+        """
+        output = [0, 0]
+        inversion = [0, 0]
+        configuration = [0, 0]
+
+        for pin, settings in board.get("pins", {}).items():
+            pin = int(pin)
+            if pin < 0 or pin > 7:
+                raise ValueError("Invalid pin %d in profile" % pin)
+            bit = 1 << pin
+
+            if "mode" in settings:
+                mode = settings["mode"]
+                mode = self._MODES[mode.lower()] if isinstance(mode, str) else mode
+                configuration[1] |= bit
+                if mode == QwiicGPIO.GPIO_IN:
+                    configuration[0] |= bit
+
+            if "level" in settings:
+                level = settings["level"]
+                level = self._LEVELS[level.lower()] if isinstance(level, str) else level
+                output[1] |= bit
+                if level:
+                    output[0] |= bit
+
+            if "invert" in settings:
+                inversion[1] |= bit
+                if settings["invert"]:
+                    inversion[0] |= bit
+
+        return tuple(output), tuple(inversion), tuple(configuration)
+
+    def apply(self, devices, sync=False, reset=False):
+        """!
+        Bring one or more boards to the state described by the profile. Each register
+        is written at most once per board, and only if it differs from the cached
+        value: output levels first, then inversion, then configuration.
+
+        After a reset the cache still holds the old values, so a plain apply() finds
+        nothing to do. Pass reset=True to forget the cached values of the registers the
+        profile sets, so they are written again (at most three writes per board;
+        registers the profile only partly sets are read first), or sync=True to compare
+        with the chip.
+
+        @param devices: A QwiicGPIO object, a list of them, or a QwiicGPIOBank. A
+                    single-board profile without an address is applied to every device.
+        @param sync: If True, read the registers with snapshot() first and compare the
+                    profile with the chip rather than with the cache. Use this after a
+                    possible reset or when another program may have changed the board.
+        @param reset: If True, forget the cached chip values of the registers the
+                    profile sets, so each of them is written. Use this after a known
+                    reset.
+
+        @return  No return value
+        """
+        if isinstance(devices, QwiicGPIOBank):
+            devices = devices.boards
+        elif not isinstance(devices, (list, tuple)):
+            devices = [devices]
+
+        byAddress = {}
+        for device in devices:
+            byAddress[device.address] = device
+
+        for address, registers in self.boards.items():
+            if address == None:
+                targets = devices
+            elif address in byAddress:
+                targets = [byAddress[address]]
+            else:
+                raise ValueError("No device at address 0x%02X for this profile" % address)
+
+            for device in targets:
+                self._applyBoard(device, registers, sync, reset)
+
+    def _applyBoard(self, device, registers, sync, reset):
+        output, inversion, configuration = registers
+        masks = ((device.REG_OUTPUT_PORT, output[1]), (device.REG_INVERSION, inversion[1]),
+                 (device.REG_CONFIGURATION, configuration[1]))
+
+        if reset:
+            for register, mask in masks:
+                if mask:
+                    device.invalidate(register)
+
+        if sync:
+            device.snapshot()
+        else:
+            # Bits the profile does not mention keep the chip's value, so a partial
+            # register must be read first if the chip value is not known
+            for register, mask in masks:
+                if mask and mask != 0xFF and not (device._known[0] | device._dirty) & (1 << register):
+                    device._readRegister(register)
+
+        with device.batch():
+            if output[1]:
+                device.writePortMask(output[0], output[1])
+            if inversion[1]:
+                device.setInversionMask(inversion[0], inversion[1])
+            if configuration[1]:
+                device.setModeMask(configuration[0], configuration[1])
+
+# Several Qwiic GPIO boards on one bus, driven as a single wide port. Board n (in
+# address order) holds pins 8n through 8n + 7, and wide masks are plain Python ints
+# with bit 0 being pin 0 of the first board.
+
+class QwiicGPIOBank(object):
+    """!
+    QwiicGPIOBank
+
+    @param addresses: The I2C addresses of the boards, in pin order. If not provided,
+                    every address in QwiicGPIO.available_addresses is checked and the
+                    connected boards are used in ascending address order.
+    @param i2c_driver: An existing i2c driver object. If not provided 
+                    a driver object is created.
+
+    @return **Object** The GPIO bank object.
+    """
+
+    # Constructor
+    def __init__(self, addresses=None, i2c_driver=None):
+
+        if i2c_driver == None:
+            i2c_driver = qwiic_i2c.getI2CDriver()
+            if i2c_driver == None:
+                print("Unable to load I2C driver for this platform.")
+                return
+
+        self._i2c = i2c_driver
+
+        if addresses == None:
+            self.boards = []
+            for address in sorted(QwiicGPIO.available_addresses):
+                board = QwiicGPIO(address, i2c_driver)
+                if board.isConnected():
+                    self.boards.append(board)
+        else:
+            self.boards = [QwiicGPIO(address, i2c_driver) for address in addresses]
+
+        self.numPins = QwiicGPIO.NUM_GPIO * len(self.boards)
+
+    def isConnected(self):
+        """!
+        Determine if every board in the bank is connected to the system.
+
+        @return **bool** True if all boards are connected, otherwise False.
+        """
+        return len(self.boards) > 0 and all(board.isConnected() for board in self.boards)
+
+    def begin(self):
+        """!
+        Initialize the operation of the bank.
+
+        @return **bool** Returns true of the initializtion was successful, otherwise False.
+        """
+        return self.isConnected()
+
+    def batch(self):
+        """!
+        Defer register writes on every board until the end of a with block. See
+        QwiicGPIO.batch().
+
+        @return **Object** A context manager. Entering it returns this bank.
+        """
+        return _GPIOBankBatch(self)
+
+    def _board(self, pin):
+        """!
+        Find the board and local pin number for a bank pin.
+
+        @param pin: The bank pin number.
+
+        @return **tuple** The QwiicGPIO object and the pin number on that board, or
+                (None, None) if pin is out of range.
+        """
+        if pin < 0 or pin >= self.numPins:
+            return None, None
+
+        return self.boards[pin >> 3], pin & 7
+
+    def pinMode(self, pin, mode):
+        """!
+        Set the mode of a single pin.
+
+        @param pin: The bank pin number to set the mode of.
+        @param mode: The mode to set the pin to.
+
+        @return  No return value
+        """
+        board, localPin = self._board(pin)
+        if board != None:
+            board.pinMode(localPin, mode)
+
+    def invertPin(self, pin, invert):
+        """!
+        Set the inversion of a single pin.
+
+        @param pin: The bank pin number to set the inversion of.
+        @param invert: The inversion to set the pin to.
+
+        @return  No return value
+        """
+        board, localPin = self._board(pin)
+        if board != None:
+            board.invertPin(localPin, invert)
+
+    def digitalWrite(self, pin, value):
+        """!
+        Set the output value of a single pin.
+
+        @param pin: The bank pin number to set the output value of.
+        @param value: The value to set the pin to.
+
+        @return  No return value
+        """
+        board, localPin = self._board(pin)
+        if board != None:
+            board.digitalWrite(localPin, value)
+
+    def digitalRead(self, pin):
+        """!
+        Get the input value of a single pin.
+
+        @param pin: The bank pin number to get the input value of.
+
+        @return **bool** The value of the pin.
+        """
+        board, localPin = self._board(pin)
+        if board == None:
+            return
+
+        return board.digitalRead(localPin)
+
+    def _writeMask(self, method, value, mask):
+        """!
+        Split a wide value and mask into per-board bytes and call method on each board
+        that has at least one pin selected. Boards whose register already holds the
+        requested bits are not written.
+
+        @param method: The QwiicGPIO mask method to call, e.g. QwiicGPIO.writePortMask.
+        @param value: The wide value.
+        @param mask: The wide mask, or None for every pin.
+
+        @return  No return value
+        """
+        for i, board in enumerate(self.boards):
+            shift = i << 3
+            boardMask = 0xFF if mask == None else (mask >> shift) & 0xFF
+            if boardMask:
+                method(board, (value >> shift) & 0xFF, boardMask)
+
+    def writePortMask(self, value, mask=None):
+        """!
+        Set the output value of the pins selected by mask.
+
+        @param value: The wide output value. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to every pin in the bank.
+
+        @return  No return value
+        """
+        self._writeMask(QwiicGPIO.writePortMask, value, mask)
+
+    def setModeMask(self, value, mask=None):
+        """!
+        Set the mode of the pins selected by mask. A 1 bit makes the pin an input.
+
+        @param value: The wide mode value. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to every pin in the bank.
+
+        @return  No return value
+        """
+        self._writeMask(QwiicGPIO.setModeMask, value, mask)
+
+    def setInversionMask(self, value, mask=None):
+        """!
+        Set the input inversion of the pins selected by mask. A 1 bit inverts the pin.
+
+        @param value: The wide inversion value. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to every pin in the bank.
+
+        @return  No return value
+        """
+        self._writeMask(QwiicGPIO.setInversionMask, value, mask)
+
+    def readPortMask(self, mask=None):
+        """!
+        Get the input value of the bank. Only boards with at least one pin selected by
+        mask are read; the bits of the other boards are returned as 0.
+
+        @param mask: The pins of interest. Defaults to every pin in the bank.
+
+        @return **int** The wide input value.
+        """
+        value = 0
+
+        for i, board in enumerate(self.boards):
+            shift = i << 3
+            if mask == None or (mask >> shift) & 0xFF:
+                value |= board.getGPIO() << shift
+
+        return value
+
+    def getOutputMask(self):
+        """!
+        Get the cached output value of the bank, without any bus traffic.
+
+        @return **int** The wide output value.
+        """
+        value = 0
+
+        for i, board in enumerate(self.boards):
+            value |= board._shadow[QwiicGPIO.REG_OUTPUT_PORT] << (i << 3)
+
+        return value
+
+# Context manager returned by QwiicGPIOBank.batch()
+
+class _GPIOBankBatch(object):
+    """!
+    Deferred-flush context for every board of a QwiicGPIOBank.
+
+    @param bank: The QwiicGPIOBank object to batch writes for.
+    """
+    def __init__(self, bank):
+        self._bank = bank
+
+    def __enter__(self):
+        for board in self._bank.boards:
+            board._batchDepth += 1
+        return self._bank
+
+    def __exit__(self, excType, excValue, traceback):
+        for board in self._bank.boards:
+            board._batchDepth -= 1
+            if board._batchDepth == 0:
+                board.flush()
+        return False
+
+# Serialized, prioritized access to an I2C driver shared by several devices and
+# threads. The scheduler has the same interface as a qwiic_i2c driver object, so it
+# (or one of its clients) can be passed as i2c_driver to QwiicGPIO or any other qwiic
+# device. There is no worker thread: the calling thread runs its own transaction once
+# the bus is free and no higher priority request is waiting.
+
+class QwiicBusScheduler(object):
+    """!
+    QwiicBusScheduler
+
+    Transactions are granted in priority order, first come first served within a
+    priority. A write queued while an earlier write from the same client to the same
+    address and register is still waiting replaces that write's value, so only the
+    latest value is sent; both callers return once it has been written. Writes from
+    different clients are never merged, since each QwiicGPIO object caches the value
+    it wrote. Use one client per QwiicGPIO object sharing an address.
+
+    Other driver methods, such as isDeviceConnected(), are scheduled too, at the
+    client's read priority.
+
+    Give background work a lower priority with a separate client, for example a
+    QwiicGPIOPoller on its own QwiicGPIO object:
+
+        scheduler = QwiicBusScheduler(qwiic_i2c.getI2CDriver())
+        myGPIO = QwiicGPIO(i2c_driver=scheduler)
+        pollGPIO = QwiicGPIO(i2c_driver=scheduler.client(QwiicBusScheduler.PRIORITY_LOW))
+        poller = QwiicGPIOPoller(pollGPIO)
+
+    @param i2c_driver: The I2C driver object to share. If not provided
+                    a driver object is created.
+
+    @return **Object** The scheduler object.
+    """
+
+    # Priority classes, highest first
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 1
+    PRIORITY_LOW = 2
+
+    # Constructor
+    def __init__(self, i2c_driver=None):
+        if threading == None:
+            raise RuntimeError("The bus scheduler requires the threading module")
+
+        if i2c_driver == None:
+            i2c_driver = qwiic_i2c.getI2CDriver()
+            if i2c_driver == None:
+                print("Unable to load I2C driver for this platform.")
+                return
+
+        self._driver = i2c_driver
+        self._condition = threading.Condition()
+        self._queues = [[], [], []]
+        self._busy = False
+
+        # Default priorities when the scheduler itself is used as a driver
+        self._default = self.client(self.PRIORITY_NORMAL, self.PRIORITY_HIGH)
+
+        self.resetStatistics()
+
+    def client(self, readPriority=PRIORITY_NORMAL, writePriority=PRIORITY_HIGH):
+        """!
+        Get a driver object whose transactions use the given priorities.
+
+        @param readPriority: The priority class for reads.
+        @param writePriority: The priority class for writes.
+
+        @return **Object** A driver object to pass as i2c_driver.
+        """
+        return _BusClient(self, readPriority, writePriority)
+
+    def resetStatistics(self):
+        """!
+        Set all statistics back to zero.
+
+        @return  No return value
+        """
+        with self._condition:
+            # Per priority class: transactions run, total and longest wait in seconds
+            self.grantCount = [0, 0, 0]
+            self.waitTime = [0.0, 0.0, 0.0]
+            self.maxWaitTime = [0.0, 0.0, 0.0]
+
+            # Writes absorbed into a newer write to the same register
+            self.coalescedWrites = 0
+
+    def pending(self):
+        """!
+        Get the number of requests waiting for the bus.
+
+        @return **int** The number of queued requests.
+        """
+        with self._condition:
+            return sum(len(queue) for queue in self._queues)
+
+    def submit(self, priority, operation, address, register, *args, **kwargs):
+        """!
+        Run one driver call once the scheduler grants the bus.
+
+        @param priority: The priority class, PRIORITY_HIGH to PRIORITY_LOW.
+        @param operation: The driver method name, e.g. "readByte".
+        @param address: The device address.
+        @param register: The register address.
+        @param args: Any further arguments for the driver method.
+        @param source: Keyword only. The client submitting the call. Byte writes are only
+                    merged with pending writes from the same source; None never merges.
+
+        @return The driver method's return value.
+        """
+        return self._submit(priority, operation, (address, register) + args, None,
+                            kwargs.get("source"))
+
+    def _submit(self, priority, operation, args, kwargs, source):
+        """!
+        Queue a driver call as operation(*args, **kwargs) and run it when granted.
+        """
+        request = _BusRequest(operation, args, kwargs, source)
+        queued = time.monotonic()
+
+        with self._condition:
+            queue = self._queues[priority]
+
+            if operation == "writeByte" and source != None:
+                for pendingRequest in queue:
+                    if pendingRequest.operation == "writeByte" and pendingRequest.source is source \
+                            and pendingRequest.args[:2] == args[:2]:
+                        pendingRequest.args = args
+                        self.coalescedWrites += 1
+                        while not pendingRequest.done:
+                            self._condition.wait()
+                        if pendingRequest.error != None:
+                            raise pendingRequest.error
+                        return None
+
+            queue.append(request)
+
+            while self._busy or self._next() is not request:
+                self._condition.wait()
+
+            queue.pop(0)
+            self._busy = True
+
+            waited = time.monotonic() - queued
+            self.grantCount[priority] += 1
+            self.waitTime[priority] += waited
+            if waited > self.maxWaitTime[priority]:
+                self.maxWaitTime[priority] = waited
+
+        try:
+            request.result = getattr(self._driver, operation)(*request.args, **(request.kwargs or {}))
+        except Exception as error:
+            request.error = error
+
+        with self._condition:
+            request.done = True
+            self._busy = False
+            self._condition.notify_all()
+
+        if request.error != None:
+            raise request.error
+
+        return request.result
+
+    def _next(self):
+        for queue in self._queues:
+            if queue:
+                return queue[0]
+        return None
+
+    # Driver interface, using the default priorities
+
+    def __getattr__(self, name):
+        return getattr(self._default, name)
+
+    def readByte(self, address, commandCode=None):
+        return self._default.readByte(address, commandCode)
+
+    def writeByte(self, address, commandCode, value):
+        return self._default.writeByte(address, commandCode, value)
+
+    def readBlock(self, address, commandCode, nBytes):
+        return self._default.readBlock(address, commandCode, nBytes)
+
+    def writeBlock(self, address, commandCode, value):
+        return self._default.writeBlock(address, commandCode, value)
+
+# A queued driver call, used by QwiicBusScheduler
+
+class _BusRequest(object):
+    def __init__(self, operation, args, kwargs, source):
+        self.operation = operation
+        self.args = args
+        self.kwargs = kwargs
+        self.source = source
+        self.done = False
+        self.result = None
+        self.error = None
+
+# Driver object returned by QwiicBusScheduler.client()
+
+class _BusClient(object):
+    """!
+    Driver interface that submits every call to a QwiicBusScheduler.
+
+    @param scheduler: The QwiicBusScheduler to submit to.
+    @param readPriority: The priority class for reads.
+    @param writePriority: The priority class for writes.
+    """
+    def __init__(self, scheduler, readPriority, writePriority):
+        self._scheduler = scheduler
+        self.readPriority = readPriority
+        self.writePriority = writePriority
+
+    def __getattr__(self, name):
+        # Any other driver method, e.g. isDeviceConnected(), is scheduled as a read
+        attribute = getattr(self._scheduler._driver, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            return self._scheduler._submit(self.readPriority, name, args, kwargs, self)
+        return call
+
+    def readByte(self, address, commandCode=None):
+        return self._scheduler._submit(self.readPriority, "readByte", (address, commandCode), None, self)
+
+    def writeByte(self, address, commandCode, value):
+        return self._scheduler._submit(self.writePriority, "writeByte", (address, commandCode, value),
+                                       None, self)
+
+    def readBlock(self, address, commandCode, nBytes):
+        return self._scheduler._submit(self.readPriority, "readBlock", (address, commandCode, nBytes),
+                                       None, self)
+
+    def writeBlock(self, address, commandCode, value):
+        return self._scheduler._submit(self.writePriority, "writeBlock", (address, commandCode, value),
+                                       None, self)
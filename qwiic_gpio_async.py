@@ -0,0 +1,358 @@
+#-----------------------------------------------------------------------------
+# qwiic_gpio_async.py
+#
+# asyncio interface for the SparkFun qwiic gpio board.
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem 
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+
+"""!
+qwiic_gpio_async
+============
+asyncio interface for the Qwiic GPIO.
+
+AsyncQwiicGPIO mirrors the QwiicGPIO API as coroutines. Bus transactions run on a
+single worker thread per I2C driver, so a slow transaction on one bus never blocks
+the event loop or devices on other buses. Devices created without an i2c_driver
+share one default driver, and so one worker thread.
+
+Only AsyncQwiicGPIO calls go through the worker. A synchronous QwiicGPIO using the
+same driver object is not serialized with them.
+
+This module requires CPython; it is not available on MicroPython or CircuitPython.
+"""
+#-----------------------------------------------------------------------------
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import qwiic_i2c
+import qwiic_gpio
+
+# One single-thread executor per I2C driver object. The single worker serializes every
+# transaction issued through AsyncQwiicGPIO on that bus, which acts as the bus lock.
+# The driver object is kept alongside the executor so its id() cannot be reused.
+_busExecutors = {}
+_busExecutorsLock = threading.Lock()
+
+def _getBusExecutor(i2cDriver):
+    """!
+    Get the executor used for all transactions on an I2C driver, creating it if needed.
+
+    @param i2cDriver: The I2C driver object.
+
+    @return **ThreadPoolExecutor** The executor for this bus.
+    """
+    with _busExecutorsLock:
+        entry = _busExecutors.get(id(i2cDriver))
+        if entry is None:
+            entry = (i2cDriver, ThreadPoolExecutor(max_workers=1))
+            _busExecutors[id(i2cDriver)] = entry
+
+        return entry[1]
+
+# The driver used by every AsyncQwiicGPIO created without an i2c_driver, so that they
+# all share one executor even if getI2CDriver() returns a new object on each call
+_defaultDriver = None
+
+def _getDefaultDriver():
+    """!
+    Get the shared default I2C driver, creating it on first use.
+
+    @return **Object** The driver, or None if no driver is available for this platform.
+    """
+    global _defaultDriver
+
+    with _busExecutorsLock:
+        if _defaultDriver is None:
+            _defaultDriver = qwiic_i2c.getI2CDriver()
+
+        return _defaultDriver
+
+class AsyncQwiicGPIO(object):
+    """!
+    AsyncQwiicGPIO
+
+    @param address: The I2C address to use for the device. 
+                    If not provided, the default address is used.
+    @param i2c_driver: An existing i2c driver object. If not provided 
+                    a driver object is created.
+
+    @return **Object** The asyncio GPIO device object.
+    """
+    device_name         = qwiic_gpio.QwiicGPIO.device_name
+    available_addresses = qwiic_gpio.QwiicGPIO.available_addresses
+
+    GPIO_OUT = qwiic_gpio.QwiicGPIO.GPIO_OUT
+    GPIO_IN = qwiic_gpio.QwiicGPIO.GPIO_IN
+
+    GPIO_LO = qwiic_gpio.QwiicGPIO.GPIO_LO
+    GPIO_HI = qwiic_gpio.QwiicGPIO.GPIO_HI
+
+    INVERT = qwiic_gpio.QwiicGPIO.INVERT
+    NO_INVERT = qwiic_gpio.QwiicGPIO.NO_INVERT
+
+    NUM_GPIO = qwiic_gpio.QwiicGPIO.NUM_GPIO
+
+    # Constructor
+    def __init__(self, address=None, i2c_driver=None):
+
+        if i2c_driver is None:
+            i2c_driver = _getDefaultDriver()
+
+        # The synchronous device object that does the actual work. Its cached pin
+        # values (modes, out_statuses, ...) can be read directly.
+        self.device = qwiic_gpio.QwiicGPIO(address, i2c_driver)
+        self._executor = _getBusExecutor(self.device._i2c)
+
+    @property
+    def address(self):
+        """!
+        The I2C address of the device.
+        """
+        return self.device.address
+
+    async def _run(self, method, *args):
+        """!
+        Run a QwiicGPIO method on the bus executor.
+
+        @param method: The bound method to call.
+        @param args: Arguments for the method.
+
+        @return The method's return value.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, method, *args)
+
+    async def isConnected(self):
+        """!
+        Determine if a Qwiic GPIO device is connected to the system.
+
+        @return **bool** True if the device is connected, otherwise False.
+        """
+        return await self._run(self.device.isConnected)
+
+    async def begin(self):
+        """!
+        Initialize the operation of the Qwiic GPIO
+
+        @return **bool** Returns true of the initializtion was successful, otherwise False.
+        """
+        return await self._run(self.device.begin)
+
+    async def setMode(self):
+        """!
+        Send the cached mode of all 8 pins to the GPIO.
+
+        @return  No return value
+        """
+        await self._run(self.device.setMode)
+
+    async def getMode(self):
+        """!
+        Read the mode register and update the cached pin modes.
+
+        @return **8 bit unsigned integer** The value of the mode register.
+        """
+        return await self._run(self.device.getMode)
+
+    async def setInversion(self):
+        """!
+        Send the cached inversion of all 8 pins to the GPIO.
+
+        @return  No return value
+        """
+        await self._run(self.device.setInversion)
+
+    async def getInversion(self):
+        """!
+        Read the inversion register and update the cached pin inversions.
+
+        @return **8 bit unsigned integer** The value of the inversion register.
+        """
+        return await self._run(self.device.getInversion)
+
+    async def setGPIO(self):
+        """!
+        Send the cached output value of all 8 pins to the GPIO.
+
+        @return  No return value
+        """
+        await self._run(self.device.setGPIO)
+
+    async def getGPIO(self):
+        """!
+        Read the input register and update the cached input values.
+
+        @return **8 bit unsigned integer** The value of the input register.
+        """
+        return await self._run(self.device.getGPIO)
+
+    async def pinMode(self, pin, mode):
+        """!
+        Set the mode of a single pin.
+
+        @param pin: The pin number to set the mode of.
+        @param mode: The mode to set the pin to.
+
+        @return  No return value
+        """
+        await self._run(self.device.pinMode, pin, mode)
+
+    async def pinModePort(self, gpioPinModeList):
+        """!
+        Set the mode of a list of pins.
+
+        @param gpioPinModeList: A list of boolean modes to set the pins at each index to.
+
+        @return  No return value
+        """
+        await self._run(self.device.pinModePort, gpioPinModeList)
+
+    async def invertPin(self, pin, invert):
+        """!
+        Set the inversion of a single pin.
+
+        @param pin: The pin number to set the inversion of.
+        @param invert: The inversion to set the pin to.
+
+        @return  No return value
+        """
+        await self._run(self.device.invertPin, pin, invert)
+
+    async def invertPinPort(self, gpioInversionList):
+        """!
+        Set the inversion of a list of pins.
+
+        @param gpioInversionList: A list of boolean inversions to set the pins at each index to.
+
+        @return  No return value
+        """
+        await self._run(self.device.invertPinPort, gpioInversionList)
+
+    async def digitalWrite(self, pin, value):
+        """!
+        Set the output value of a single pin.
+
+        @param pin: The pin number to set the output value of.
+        @param value: The value to set the pin to.
+
+        @return  No return value
+        """
+        await self._run(self.device.digitalWrite, pin, value)
+
+    async def digitalWritePort(self, gpioOutputList):
+        """!
+        Set the output value of a list of pins.
+
+        @param gpioOutputList: A list of boolean output values to set the pins at each index to.
+
+        @return  No return value
+        """
+        await self._run(self.device.digitalWritePort, gpioOutputList)
+
+    async def digitalRead(self, pin):
+        """!
+        Get the input value of a single pin.
+
+        @param pin: The pin number to get the input value of.
+
+        @return **bool** The value of the pin.
+        """
+        return await self._run(self.device.digitalRead, pin)
+
+    async def digitalReadPort(self):
+        """!
+        Get the input value of all pins.
+
+        @return  A list of boolean input values of all pins.
+        """
+        value = await self._run(self.device.getGPIO)
+        return [(value >> i) & 1 for i in range(self.NUM_GPIO)]
+
+    async def writePortMask(self, value, mask=0xFF):
+        """!
+        Set the output value of the pins selected by mask.
+
+        @param value: The output byte. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to all 8 pins.
+
+        @return  No return value
+        """
+        await self._run(self.device.writePortMask, value, mask)
+
+    async def readPortMask(self):
+        """!
+        Get the input value of all pins as a byte.
+
+        @return **8 bit unsigned integer** The value of the input register.
+        """
+        return await self._run(self.device.readPortMask)
+
+    async def setModeMask(self, value, mask=0xFF):
+        """!
+        Set the mode of the pins selected by mask.
+
+        @param value: The mode byte. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to all 8 pins.
+
+        @return  No return value
+        """
+        await self._run(self.device.setModeMask, value, mask)
+
+    async def setInversionMask(self, value, mask=0xFF):
+        """!
+        Set the input inversion of the pins selected by mask.
+
+        @param value: The inversion byte. Bits outside mask are ignored.
+        @param mask: The pins to change. Defaults to all 8 pins.
+
+        @return  No return value
+        """
+        await self._run(self.device.setInversionMask, value, mask)
+
+    async def flush(self):
+        """!
+        Write any register whose cached value differs from the chip.
+
+        @return  No return value
+        """
+        await self._run(self.device.flush)
+
+    async def snapshot(self):
+        """!
+        Read all four registers and refresh the cached pin values.
+
+        @return **GPIOSnapshot** The four register values.
+        """
+        return await self._run(self.device.snapshot)
@@ -0,0 +1,381 @@
+#-----------------------------------------------------------------------------
+# qwiic_gpio_log.py
+#
+# Binary input sample log for the SparkFun qwiic gpio board.
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem 
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+
+"""!
+qwiic_gpio_log
+============
+Binary input sample log for the Qwiic GPIO.
+
+QwiicGPIORecorder appends timestamped input samples from one or more boards to a file
+of fixed-width records. QwiicGPIOLogReader memory-maps such a file for iteration,
+time range queries and replay into QwiicGPIODebouncer, QwiicGPIOCapture or the
+simulated driver.
+
+File layout, all little-endian:
+  - 16 byte header: b"QGPL", format version (1 byte), board count n (1 byte),
+    2 reserved bytes, then the I2C address of each board (8 bytes, unused ones 0)
+  - records of 8 + n bytes: a float64 time.time() timestamp, then the input byte
+    of each board
+
+This module requires CPython; it is not available on MicroPython or CircuitPython.
+"""
+#-----------------------------------------------------------------------------
+
+import mmap
+import struct
+import time
+
+_MAGIC = b"QGPL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB2x8s")
+_TIMESTAMP = struct.Struct("<d")
+
+class QwiicGPIORecorder(object):
+    """!
+    QwiicGPIORecorder
+
+    @param path: The file to write. An existing file is replaced.
+    @param devices: A QwiicGPIO object or a list of up to 8 of them.
+    @param bufferRecords: The number of records held in memory between writes to disk.
+
+    @return **Object** The recorder object. Close it, or use it in a with block, to
+            write out the last records.
+    """
+
+    # Constructor
+    def __init__(self, path, devices, bufferRecords=4096):
+        if not isinstance(devices, (list, tuple)):
+            devices = [devices]
+
+        if len(devices) < 1 or len(devices) > 8:
+            raise ValueError("A log holds between 1 and 8 boards")
+
+        self.devices = list(devices)
+        self.recordSize = _TIMESTAMP.size + len(self.devices)
+        self.recordCount = 0
+
+        self._buffer = bytearray(self.recordSize * bufferRecords)
+        self._bufferRecords = bufferRecords
+        self._used = 0
+        self._attached = None
+
+        addresses = bytes(bytearray([device.address for device in self.devices] + [0] * (8 - len(self.devices))))
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, len(self.devices), addresses))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+        return False
+
+    def append(self, values, timestamp=None):
+        """!
+        Add one record.
+
+        @param values: The input byte of each board, in the order of devices.
+        @param timestamp: The sample time. Defaults to time.time().
+
+        @return  No return value
+        """
+        if timestamp == None:
+            timestamp = time.time()
+
+        offset = self._used * self.recordSize
+        _TIMESTAMP.pack_into(self._buffer, offset, timestamp)
+        offset += _TIMESTAMP.size
+        for value in values:
+            self._buffer[offset] = value & 0xFF
+            offset += 1
+
+        self._used += 1
+        self.recordCount += 1
+        if self._used == self._bufferRecords:
+            self.flush()
+
+    def sample(self):
+        """!
+        Read the input register of every board and add the values as one record.
+
+        @return **list** The input byte of each board.
+        """
+        timestamp = time.time()
+        values = [device.getGPIO() for device in self.devices]
+        self.append(values, timestamp)
+
+        return values
+
+    def attach(self):
+        """!
+        Record every input byte read from the board, whichever method reads it (a
+        QwiicGPIOPoller, digitalRead(), ...). Only possible for a single board log.
+
+        @return  No return value
+        """
+        if len(self.devices) != 1:
+            raise ValueError("attach() needs a single board log; use sample() for several boards")
+
+        self.detach()
+        self._attached = lambda value: self.append((value,))
+        self.devices[0].addInputListener(self._attached)
+
+    def detach(self):
+        """!
+        Stop recording input reads started by attach().
+
+        @return  No return value
+        """
+        if self._attached != None:
+            self.devices[0].removeInputListener(self._attached)
+            self._attached = None
+
+    def flush(self):
+        """!
+        Write buffered records to the file.
+
+        @return  No return value
+        """
+        if self._used:
+            self._file.write(memoryview(self._buffer)[:self._used * self.recordSize])
+            self._used = 0
+        self._file.flush()
+
+    def close(self):
+        """!
+        Stop recording, write buffered records and close the file.
+
+        @return  No return value
+        """
+        if self._file.closed:
+            return
+
+        self.detach()
+        self.flush()
+        self._file.close()
+
+class QwiicGPIOLogReader(object):
+    """!
+    QwiicGPIOLogReader
+
+    Records are read straight from the memory-mapped file; nothing is loaded up front.
+    Indexing returns (timestamp, values) tuples, values holding the input byte of each
+    board.
+
+    @param path: The log file to read.
+
+    @return **Object** The reader object. Close it, or use it in a with block, when done.
+    """
+
+    # Constructor
+    def __init__(self, path):
+        self._file = open(path, "rb")
+
+        header = self._file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            self._file.close()
+            raise ValueError("Not a Qwiic GPIO log: file too short")
+
+        magic, version, boardCount, addresses = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION:
+            self._file.close()
+            raise ValueError("Not a Qwiic GPIO log, or an unsupported version")
+
+        self.addresses = list(bytearray(addresses))[:boardCount]
+        self.recordSize = _TIMESTAMP.size + boardCount
+
+        self._file.seek(0, 2)
+        fileSize = self._file.tell()
+        self._count = (fileSize - _HEADER.size) // self.recordSize
+
+        if self._count:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+        else:
+            self._map = None
+            self._view = memoryview(b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """!
+        Release the memory map and close the file.
+
+        @return  No return value
+        """
+        self._view.release()
+        if self._map != None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def _offset(self, index):
+        return _HEADER.size + index * self.recordSize
+
+    def timestamp(self, index):
+        """!
+        Get the timestamp of one record.
+
+        @param index: The record number.
+
+        @return **float** The timestamp.
+        """
+        return _TIMESTAMP.unpack_from(self._view, self._offset(index))[0]
+
+    def value(self, index, board=0):
+        """!
+        Get the input byte of one board in one record.
+
+        @param index: The record number.
+        @param board: The board position in the log.
+
+        @return **8 bit unsigned integer** The input byte.
+        """
+        return self._view[self._offset(index) + _TIMESTAMP.size + board]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("record index out of range")
+
+        offset = self._offset(index)
+        start = offset + _TIMESTAMP.size
+
+        return (_TIMESTAMP.unpack_from(self._view, offset)[0],
+                tuple(self._view[start:start + len(self.addresses)]))
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def _bisect(self, timestamp):
+        """!
+        Find the first record at or after a time. Records are assumed to be in time order.
+        """
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def indexRange(self, start=None, end=None):
+        """!
+        Find the records with start <= timestamp < end.
+
+        @param start: The earliest timestamp. Defaults to the start of the log.
+        @param end: The timestamp to stop before. Defaults to the end of the log.
+
+        @return **range** The matching record numbers.
+        """
+        first = 0 if start == None else self._bisect(start)
+        last = self._count if end == None else self._bisect(end)
+
+        return range(first, max(first, last))
+
+    def between(self, start=None, end=None):
+        """!
+        Iterate over the records with start <= timestamp < end.
+
+        @param start: The earliest timestamp. Defaults to the start of the log.
+        @param end: The timestamp to stop before. Defaults to the end of the log.
+
+        @return **iterator** (timestamp, values) tuples.
+        """
+        for index in self.indexRange(start, end):
+            yield self[index]
+
+    def samples(self, board=0, start=None, end=None):
+        """!
+        Iterate over the input bytes of one board. The result can be passed to
+        QwiicGPIOSimDriver.setInputWaveform() to replay the log through QwiicGPIO;
+        configure every pin as a non-inverted input to get the recorded bytes back.
+
+        @param board: The board position in the log.
+        @param start: The earliest timestamp. Defaults to the start of the log.
+        @param end: The timestamp to stop before. Defaults to the end of the log.
+
+        @return **iterator** Input bytes.
+        """
+        for index in self.indexRange(start, end):
+            yield self.value(index, board)
+
+    def replay(self, callback, board=0, start=None, end=None, realtime=False):
+        """!
+        Feed recorded samples to a function such as QwiicGPIOCapture.update() or
+        QwiicGPIODebouncer.update().
+
+        @param callback: Called as callback(value, timestamp) for each record. Use
+                        lambda value, timestamp: debouncer.update(value) for functions
+                        that take only the sample.
+        @param board: The board position in the log.
+        @param start: The earliest timestamp. Defaults to the start of the log.
+        @param end: The timestamp to stop before. Defaults to the end of the log.
+        @param realtime: If True, wait between records to reproduce the recorded timing.
+
+        @return **int** The number of records replayed.
+        """
+        count = 0
+        firstTimestamp = None
+        startTime = time.monotonic()
+
+        for index in self.indexRange(start, end):
+            timestamp = self.timestamp(index)
+
+            if realtime:
+                if firstTimestamp == None:
+                    firstTimestamp = timestamp
+                delay = (timestamp - firstTimestamp) - (time.monotonic() - startTime)
+                if delay > 0:
+                    time.sleep(delay)
+
+            callback(self.value(index, board), timestamp)
+            count += 1
+
+        return count
@@ -0,0 +1,344 @@
+#-----------------------------------------------------------------------------
+# qwiic_gpio_sim.py
+#
+# Simulated I2C driver for the SparkFun qwiic gpio board.
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem 
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+
+"""!
+qwiic_gpio_sim
+============
+Simulated I2C driver for the Qwiic GPIO.
+
+QwiicGPIOSimDriver stands in for a qwiic_i2c driver object and emulates one or more
+PCA9554/TCA9534 style expanders in memory, so QwiicGPIO can be exercised and
+benchmarked without any hardware:
+
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    myGPIO = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+
+Each simulated device models the four registers: the input register reads the pin
+levels XOR the inversion register, the output register only drives pins configured
+as outputs, and the device powers up with every pin an input.
+"""
+#-----------------------------------------------------------------------------
+
+import time
+
+try:
+    import threading
+except ImportError:
+    threading = None
+
+# Register addresses, matching QwiicGPIO
+_REG_INPUT_PORT = 0x00
+_REG_OUTPUT_PORT = 0x01
+_REG_INVERSION = 0x02
+_REG_CONFIGURATION = 0x03
+
+class _SimulatedExpander(object):
+    """!
+    Register model of a single expander.
+    """
+    def __init__(self):
+        self.powerCycle()
+
+    def powerCycle(self):
+        """!
+        Return every register to its power-up value.
+        """
+        self.output = 0xFF
+        self.inversion = 0x00
+        self.configuration = 0xFF
+
+        # Levels driven onto input pins from outside. Pins are pulled up, so undriven
+        # inputs read high.
+        self.external = 0xFF
+        self._waveform = None
+
+    def pins(self):
+        """!
+        The level of each pin: the output register for outputs, the external
+        drive for inputs.
+        """
+        return (self.output & ~self.configuration | self.external & self.configuration) & 0xFF
+
+    def read(self, register):
+        if register == _REG_INPUT_PORT:
+            if self._waveform != None:
+                try:
+                    self.external = next(self._waveform) & 0xFF
+                except StopIteration:
+                    self._waveform = None
+            return self.pins() ^ self.inversion
+        if register == _REG_OUTPUT_PORT:
+            return self.output
+        if register == _REG_INVERSION:
+            return self.inversion
+        if register == _REG_CONFIGURATION:
+            return self.configuration
+        raise OSError("Invalid register 0x%02X" % register)
+
+    def write(self, register, value):
+        value &= 0xFF
+        if register == _REG_OUTPUT_PORT:
+            self.output = value
+        elif register == _REG_INVERSION:
+            self.inversion = value
+        elif register == _REG_CONFIGURATION:
+            self.configuration = value
+        elif register != _REG_INPUT_PORT:
+            raise OSError("Invalid register 0x%02X" % register)
+        # Writes to the input register are accepted and have no effect
+
+class QwiicGPIOSimDriver(object):
+    """!
+    QwiicGPIOSimDriver
+
+    @param addresses: The I2C addresses of the simulated expanders. Defaults to the
+                    QwiicGPIO default address, 0x27.
+    @param latency: Seconds each bus transaction takes. Defaults to no delay.
+    @param autoIncrement: True if block reads and writes advance the register
+                    pointer. The TCA9534 on the Qwiic GPIO does not, so the default
+                    is False and block transfers repeat the first register.
+
+    @return **Object** The simulated driver object.
+    """
+
+    # Constructor
+    def __init__(self, addresses=None, latency=0.0, autoIncrement=False):
+
+        if addresses == None:
+            addresses = [0x27]
+
+        self._devices = {}
+        for address in addresses:
+            self._devices[address] = _SimulatedExpander()
+
+        self.latency = latency
+        self.autoIncrement = autoIncrement
+
+        # Pending injected errors, as [remaining, operation, register, address] lists
+        self._faults = []
+
+        # Transaction statistics
+        self.transactionCount = 0
+        self.readCount = 0
+        self.writeCount = 0
+        self.bytesTransferred = 0
+        self.errorCount = 0
+
+        self._lock = threading.Lock() if threading != None else None
+
+    # ----------------------------------
+    # Test control
+
+    def _device(self, address):
+        device = self._devices.get(address)
+        if device == None:
+            raise OSError("No device acknowledged at address 0x%02X" % address)
+        return device
+
+    def setInputs(self, value, mask=0xFF, address=0x27):
+        """!
+        Drive the selected pins of a device from outside. Only pins configured as
+        inputs are affected when the device is read.
+
+        @param value: The pin levels. Bits outside mask are ignored.
+        @param mask: The pins to drive. Defaults to all 8 pins.
+        @param address: The device address.
+
+        @return  No return value
+        """
+        device = self._device(address)
+        device.external = (device.external & ~mask | value & mask) & 0xFF
+
+    def setInputWaveform(self, samples, address=0x27):
+        """!
+        Script the externally driven pin levels. Each read of the input register takes
+        the next byte from samples, so a waveform plays out one step per read. When
+        samples runs out the last level is held.
+
+        @param samples: An iterable of pin level bytes, for example a list or generator.
+        @param address: The device address.
+
+        @return  No return value
+        """
+        self._device(address)._waveform = iter(samples)
+
+    def getPins(self, address=0x27):
+        """!
+        Get the level of every pin of a device, as driven by its outputs and the
+        external inputs.
+
+        @param address: The device address.
+
+        @return **8 bit unsigned integer** The pin levels.
+        """
+        return self._device(address).pins()
+
+    def getRegisters(self, address=0x27):
+        """!
+        Get the input, output, inversion and configuration registers of a device,
+        without counting a transaction.
+
+        @param address: The device address.
+
+        @return **list** The four register values.
+        """
+        device = self._device(address)
+        return [device.pins() ^ device.inversion, device.output, device.inversion, device.configuration]
+
+    def powerCycle(self, address=0x27):
+        """!
+        Reset a device to its power-up state, as after a brown-out.
+
+        @param address: The device address.
+
+        @return  No return value
+        """
+        self._device(address).powerCycle()
+
+    def injectErrors(self, count=1, operation=None, register=None, address=None):
+        """!
+        Make upcoming transactions fail with OSError, like a NACK on the bus.
+
+        @param count: The number of transactions to fail.
+        @param operation: "read" or "write" to fail only that kind of transaction.
+        @param register: Only fail transactions to this register.
+        @param address: Only fail transactions to this device address.
+
+        @return  No return value
+        """
+        self._faults.append([count, operation, register, address])
+
+    def resetStatistics(self):
+        """!
+        Set all transaction statistics back to zero.
+
+        @return  No return value
+        """
+        self.transactionCount = 0
+        self.readCount = 0
+        self.writeCount = 0
+        self.bytesTransferred = 0
+        self.errorCount = 0
+
+    # ----------------------------------
+    # Driver interface
+
+    def _transaction(self, operation, address, register, nBytes):
+        """!
+        Account for one bus transaction and apply latency and injected errors.
+        """
+        self.transactionCount += 1
+        if operation == "read":
+            self.readCount += 1
+        else:
+            self.writeCount += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        for fault in self._faults:
+            if fault[1] not in (None, operation) or fault[2] not in (None, register) \
+                    or fault[3] not in (None, address):
+                continue
+
+            fault[0] -= 1
+            if fault[0] <= 0:
+                self._faults.remove(fault)
+            self.errorCount += 1
+            raise OSError("Injected I2C error")
+
+        device = self._device(address)
+
+        # The address byte, the register byte and the data
+        self.bytesTransferred += 2 + nBytes
+
+        return device
+
+    def isDeviceConnected(self, devAddress):
+        """!
+        Determine if a simulated device exists at an address.
+
+        @param devAddress: The I2C address.
+
+        @return **bool** True if a device exists, otherwise False.
+        """
+        return devAddress in self._devices
+
+    def scan(self):
+        """!
+        List the addresses of all simulated devices.
+
+        @return **list** The device addresses.
+        """
+        return sorted(self._devices)
+
+    def readByte(self, address, commandCode=None):
+        if self._lock != None:
+            with self._lock:
+                return self._transaction("read", address, commandCode, 1).read(commandCode)
+        return self._transaction("read", address, commandCode, 1).read(commandCode)
+
+    def writeByte(self, address, commandCode, value):
+        if self._lock != None:
+            with self._lock:
+                self._transaction("write", address, commandCode, 1).write(commandCode, value)
+            return
+        self._transaction("write", address, commandCode, 1).write(commandCode, value)
+
+    def readBlock(self, address, commandCode, nBytes):
+        if self._lock != None:
+            with self._lock:
+                return self._readBlock(address, commandCode, nBytes)
+        return self._readBlock(address, commandCode, nBytes)
+
+    def writeBlock(self, address, commandCode, value):
+        if self._lock != None:
+            with self._lock:
+                self._writeBlock(address, commandCode, value)
+            return
+        self._writeBlock(address, commandCode, value)
+
+    def _readBlock(self, address, commandCode, nBytes):
+        device = self._transaction("read", address, commandCode, nBytes)
+        if self.autoIncrement:
+            return [device.read((commandCode + i) & 0x03) for i in range(nBytes)]
+        return [device.read(commandCode) for i in range(nBytes)]
+
+    def _writeBlock(self, address, commandCode, value):
+        device = self._transaction("write", address, commandCode, len(value))
+        for i in range(len(value)):
+            device.write((commandCode + i) & 0x03 if self.autoIncrement else commandCode, value[i])
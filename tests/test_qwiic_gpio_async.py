@@ -0,0 +1,31 @@
+# Tests for AsyncQwiicGPIO, run against the simulated driver:
+#   python -m pytest tests
+
+import asyncio
+
+import qwiic_i2c
+import qwiic_gpio_async
+import qwiic_gpio_sim
+
+def test_default_driver_is_shared(monkeypatch):
+    # getI2CDriver() may return a new object on every call
+    monkeypatch.setattr(qwiic_i2c, "getI2CDriver", lambda: qwiic_gpio_sim.QwiicGPIOSimDriver([0x27, 0x26]))
+    monkeypatch.setattr(qwiic_gpio_async, "_defaultDriver", None)
+
+    first = qwiic_gpio_async.AsyncQwiicGPIO(0x27)
+    second = qwiic_gpio_async.AsyncQwiicGPIO(0x26)
+
+    assert first.device._i2c is second.device._i2c
+    assert first._executor is second._executor
+
+def test_async_write_and_read():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio_async.AsyncQwiicGPIO(i2c_driver=driver)
+
+    async def run():
+        await device.pinMode(0, device.GPIO_OUT)
+        await device.digitalWrite(0, device.GPIO_HI)
+        return await device.digitalRead(0)
+
+    assert asyncio.run(run()) == 1
+    assert driver.getRegisters()[1] & 0x01
@@ -0,0 +1,51 @@
+# Tests for QwiicGPIOBank, run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _bank():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver([0x27, 0x26])
+    bank = qwiic_gpio.QwiicGPIOBank([0x27, 0x26], driver)
+    bank.begin()
+    return driver, bank
+
+def test_scan_finds_connected_boards():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver([0x26, 0x20])
+    bank = qwiic_gpio.QwiicGPIOBank(i2c_driver=driver)
+
+    assert [board.address for board in bank.boards] == [0x20, 0x26]
+    assert bank.numPins == 16
+
+def test_wide_masks_span_boards():
+    driver, bank = _bank()
+
+    bank.setModeMask(0x0000)
+    bank.writePortMask(0xFF00 | 0x0F, 0xFF0F)
+
+    assert driver.getRegisters(0x27)[1] == 0x0F
+    assert driver.getRegisters(0x26)[1] == 0xFF
+    assert bank.getOutputMask() == 0xFF0F
+
+def test_single_pins_map_to_boards():
+    driver, bank = _bank()
+
+    bank.pinMode(9, bank.boards[0].GPIO_OUT)
+    bank.digitalWrite(9, 1)
+
+    assert driver.getRegisters(0x26)[3] & 0x02 == 0
+    assert driver.getRegisters(0x26)[1] & 0x02
+    assert driver.getRegisters(0x27) == [0xFF, 0xFF, 0x00, 0xFF]
+
+def test_bank_batch_writes_each_board_once():
+    driver, bank = _bank()
+    driver.resetStatistics()
+
+    with bank.batch():
+        for pin in range(16):
+            bank.pinMode(pin, 0)
+            bank.digitalWrite(pin, pin & 1)
+
+    assert driver.writeCount == 4
+    assert driver.getRegisters(0x27)[1] == 0xAA
+    assert driver.getRegisters(0x26)[1] == 0xAA
@@ -0,0 +1,45 @@
+# Tests for batch() and flush(), run against the simulated driver:
+#   python -m pytest tests
+
+import pytest
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _freshDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    return driver, qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+
+def test_batch_writes_each_register_once():
+    driver, device = _freshDevice()
+
+    with device.batch():
+        for pin in range(device.NUM_GPIO):
+            device.pinMode(pin, device.GPIO_OUT)
+            device.digitalWrite(pin, pin & 1)
+
+    assert driver.writeCount == 2
+    assert driver.getRegisters()[1:] == [0xAA, 0x00, 0x00]
+
+def test_batch_leaves_untouched_registers_alone():
+    driver, device = _freshDevice()
+
+    with device.batch():
+        device.digitalWrite(0, 1)
+
+    # Power-up configuration (all inputs) must survive
+    assert driver.getRegisters()[1:] == [0x01, 0x00, 0xFF]
+
+def test_failed_flush_keeps_pending_writes():
+    driver, device = _freshDevice()
+    driver.injectErrors(1, "write")
+
+    with pytest.raises(OSError):
+        with device.batch():
+            device.writePortMask(0x0F)
+            device.setModeMask(0x00)
+
+    assert driver.getRegisters()[3] == 0xFF
+
+    device.flush()
+    assert driver.getRegisters()[1:] == [0x0F, 0x00, 0x00]
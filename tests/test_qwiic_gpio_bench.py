@@ -0,0 +1,15 @@
+# Smoke test for the benchmark script:
+#   python -m pytest tests
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+import qwiic_gpio_bench
+
+def test_benchmark_reports_transactions():
+    results = dict((r["name"], r) for r in qwiic_gpio_bench.runBenchmark(iterations=20, caseFilter="snapshot"))
+
+    assert results["snapshot"]["transactions_per_op"] == 4
+    assert results["snapshot (burst, auto-increment)"]["transactions_per_op"] == 1
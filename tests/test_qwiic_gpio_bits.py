@@ -0,0 +1,104 @@
+# Tests for the bitmask API, pin handles and bit operations, run against the
+# simulated driver:
+#   python -m pytest tests
+
+import threading
+
+import pytest
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _outputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0x00)
+    device.writePortMask(0x00)
+    driver.resetStatistics()
+    return driver, device
+
+def test_mask_methods_change_only_masked_bits():
+    driver, device = _outputDevice()
+
+    device.writePortMask(0xFF, 0x0F)
+    device.setInversionMask(0xFF, 0x80)
+    device.setModeMask(0xFF, 0xF0)
+
+    assert driver.getRegisters()[1:] == [0x0F, 0x80, 0xF0]
+    assert driver.writeCount == 3
+
+def test_read_port_mask():
+    driver, device = _outputDevice()
+    device.setModeMask(0xFF)
+    driver.setInputs(0x5A)
+
+    assert device.readPortMask() == 0x5A
+
+def test_pin_handle():
+    driver, device = _outputDevice()
+    led = device.pin(3)
+
+    led.on()
+    assert driver.getRegisters()[1] == 0x08
+    led.toggle()
+    assert driver.getRegisters()[1] == 0x00
+    led.value = 1
+    assert led.output == 1
+
+    led.mode = device.GPIO_IN
+    led.invert = True
+    assert driver.getRegisters()[2:] == [0x08, 0x08]
+    assert led.mode == device.GPIO_IN
+
+@pytest.mark.parametrize("pin", [-1, 8, "1", None])
+def test_invalid_pin_handle(pin):
+    driver, device = _outputDevice()
+
+    with pytest.raises(ValueError):
+        device.pin(pin)
+
+def test_bit_operations_are_single_writes():
+    driver, device = _outputDevice()
+
+    device.setBits(0x0F)
+    device.clearBits(0x03)
+    device.toggleBits(0xF0)
+    device.writeMasked(0xAA, 0x0F)
+
+    assert driver.getRegisters()[1] == 0xFA
+    assert driver.writeCount == 4
+
+def test_bit_operations_on_other_registers():
+    driver, device = _outputDevice()
+
+    device.setBits(0x01, device.REG_INVERSION)
+    device.setBits(0x80, device.REG_CONFIGURATION)
+
+    assert driver.getRegisters()[2:] == [0x01, 0x80]
+    with pytest.raises(ValueError):
+        device.setBits(0x01, device.REG_INPUT_PORT)
+
+def test_fresh_bit_operation_reads_the_chip():
+    driver, device = _outputDevice()
+    driver.writeByte(0x27, 1, 0x80)
+
+    device.setBits(0x01, fresh=True)
+
+    assert driver.getRegisters()[1] == 0x81
+
+def test_fresh_toggles_from_threads_are_atomic():
+    driver, device = _outputDevice()
+    driver.latency = 0.0001
+
+    def toggle(bit):
+        for i in range(51):
+            device.toggleBits(1 << bit, fresh=True)
+
+    threads = [threading.Thread(target=toggle, args=(bit,)) for bit in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert driver.getRegisters()[1] == 0x0F
@@ -0,0 +1,65 @@
+# Tests for QwiicGPIODebouncer and QwiicGPIOCapture:
+#   python -m pytest tests
+
+import pytest
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def test_debouncer_needs_stable_samples():
+    debouncer = qwiic_gpio.QwiicGPIODebouncer(count=3, initial=0x00)
+
+    # A two-sample glitch on pin 0 is filtered out
+    assert [debouncer.update(sample) for sample in (0x01, 0x01, 0x00)] == [0x00, 0x00, 0x00]
+
+    # Three consecutive samples are accepted
+    assert [debouncer.update(sample) for sample in (0x01, 0x01, 0x01)] == [0x00, 0x00, 0x01]
+    assert debouncer.digitalRead(0)
+
+def test_debouncer_per_pin_counts_and_events():
+    debouncer = qwiic_gpio.QwiicGPIODebouncer(count=[1, 4, 1, 1, 1, 1, 1, 1], initial=0x00)
+    events = []
+    debouncer.subscribe(lambda pin, value: events.append((pin, value)))
+
+    debouncer.update(0x03)
+
+    assert debouncer.value == 0x01
+    assert events == [(0, 1)]
+
+def test_debouncer_rejects_bad_counts():
+    with pytest.raises(ValueError):
+        qwiic_gpio.QwiicGPIODebouncer(count=0)
+
+def test_debouncer_attached_to_device():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.setModeMask(0xFF)
+    debouncer = qwiic_gpio.QwiicGPIODebouncer(count=2)
+    debouncer.attach(device)
+
+    device.getGPIO()
+    driver.setInputs(0xFE)
+    device.getGPIO()
+    assert debouncer.value == 0xFF
+    device.getGPIO()
+    assert debouncer.value == 0xFE
+
+    debouncer.detach()
+
+def test_capture_measures_period_and_duty():
+    capture = qwiic_gpio.QwiicGPIOCapture(mask=0x01)
+
+    # 10 ms period, HIGH for 2.5 ms
+    t = 0.0
+    capture.update(0x00, t)
+    for cycle in range(4):
+        capture.update(0x01, t)
+        capture.update(0x00, t + 0.0025)
+        t += 0.010
+
+    assert capture.pulseCount(0) == 4
+    assert capture.period(0) == pytest.approx(0.010)
+    assert capture.frequency(0) == pytest.approx(100.0)
+    assert capture.pulseWidth(0) == pytest.approx(0.0025)
+    assert capture.dutyCycle(0) == pytest.approx(0.25)
+    assert capture.edgeCount(1) == 0
@@ -0,0 +1,38 @@
+# Tests for transaction instrumentation, run against the simulated driver:
+#   python -m pytest tests
+
+import pytest
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def test_counts_transactions_and_errors():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    records = []
+    stats = device.enableInstrumentation(historySize=4, hook=records.append)
+
+    device.setModeMask(0x00)
+    device.getGPIO()
+    driver.injectErrors(1, "write")
+    with pytest.raises(OSError):
+        device.writePortMask(0x01)
+
+    assert stats.transactionCount == 3
+    assert stats.errorCount == 1
+    assert stats.registerCounts == {0: 1, 1: 1, 3: 1}
+    assert stats.operationCounts == {"writeByte": 2, "readByte": 1}
+    assert [record.register for record in stats.recent()] == [3, 0, 1]
+    assert records[-1].error != None
+
+def test_disable_removes_the_wrapper():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    stats = device.enableInstrumentation()
+    device.setRetryPolicy(qwiic_gpio.QwiicGPIORetryPolicy())
+
+    device.disableInstrumentation()
+    device.getGPIO()
+
+    assert stats.transactionCount == 0
+    assert device._i2c._driver is driver
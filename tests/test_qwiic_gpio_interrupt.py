@@ -0,0 +1,67 @@
+# Tests for input callbacks and the interrupt watcher, run against the simulated
+# driver:
+#   python -m pytest tests
+
+import threading
+import time
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _inputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0xFF)
+    return driver, device
+
+def _waitFor(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+def test_attach_interrupt_edges():
+    driver, device = _inputDevice()
+    events = []
+    device.attachInterrupt(0, lambda pin, value: events.append((pin, value)), device.FALLING)
+    device.serviceInterrupt()
+
+    driver.setInputs(0x00, 0x01)
+    device.serviceInterrupt()
+    driver.setInputs(0x01, 0x01)
+    device.serviceInterrupt()
+
+    assert events == [(0, 0)]
+
+def test_watcher_survives_callback_errors():
+    driver, device = _inputDevice()
+    fired = threading.Event()
+    calls = []
+
+    def source(timeout):
+        if fired.wait(timeout):
+            fired.clear()
+            return True
+        return False
+
+    def callback(pin, value):
+        calls.append(value)
+        raise ValueError("callback failed")
+
+    device.attachInterrupt(0, callback)
+    device.startInterruptWatcher(source, timeout=0.01)
+    try:
+        assert device._lock != None
+
+        watcher = device._interruptWatcher
+        for level in (0x00, 0x01):
+            driver.setInputs(level, 0x01)
+            fired.set()
+            assert _waitFor(lambda: len(calls) == level + 1)
+
+        assert _waitFor(lambda: watcher.errorCount == 2)
+        assert isinstance(watcher.lastError, ValueError)
+        assert watcher._thread.is_alive()
+    finally:
+        device.stopInterruptWatcher()
@@ -0,0 +1,41 @@
+# Tests for lazy_sync, run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _configuredDriver():
+    # Another program has made pins 4-7 outputs, driven HIGH
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    other = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    other.writePortMask(0xF0)
+    other.setModeMask(0x0F)
+    return driver
+
+def test_pin_method_keeps_other_configuration():
+    driver = _configuredDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver, lazy_sync=True)
+
+    device.pinMode(0, device.GPIO_OUT)
+    device.digitalWrite(0, device.GPIO_HI)
+
+    assert driver.getRegisters()[1:] == [0xF1, 0x00, 0x0E]
+
+def test_legacy_list_flow_keeps_other_configuration():
+    driver = _configuredDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver, lazy_sync=True)
+
+    device.modes[0] = device.GPIO_OUT
+    device.setMode()
+
+    assert driver.getRegisters()[3] == 0x0E
+
+def test_without_lazy_sync_cache_is_assumed():
+    driver = _configuredDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    driver.resetStatistics()
+
+    device.pinMode(0, device.GPIO_OUT)
+
+    assert driver.readCount == 0
+    assert driver.getRegisters()[3] == 0x00
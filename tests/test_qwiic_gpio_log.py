@@ -0,0 +1,43 @@
+# Tests for QwiicGPIORecorder and QwiicGPIOLogReader, run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_log
+import qwiic_gpio_sim
+
+def test_record_and_read_back(tmp_path):
+    path = str(tmp_path / "inputs.qgpl")
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver([0x27, 0x26])
+    devices = [qwiic_gpio.QwiicGPIO(0x27, driver), qwiic_gpio.QwiicGPIO(0x26, driver)]
+
+    with qwiic_gpio_log.QwiicGPIORecorder(path, devices, bufferRecords=2) as recorder:
+        for i in range(5):
+            recorder.append((i, 0xF0 | i), timestamp=100.0 + i)
+        driver.setInputs(0x3C, address=0x26)
+        assert recorder.sample() == [0xFF, 0x3C]
+
+    with qwiic_gpio_log.QwiicGPIOLogReader(path) as reader:
+        assert len(reader) == 6
+        assert list(reader.addresses) == [0x27, 0x26]
+        assert reader[2] == (102.0, (2, 0xF2))
+        assert reader.value(5, board=1) == 0x3C
+        assert list(reader.samples(1, start=101.0, end=103.0)) == [0xF1, 0xF2]
+
+def test_attach_and_replay(tmp_path):
+    path = str(tmp_path / "inputs.qgpl")
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.setModeMask(0xFF)
+    driver.setInputWaveform([0x01, 0x00, 0x01, 0x00])
+
+    with qwiic_gpio_log.QwiicGPIORecorder(path, device) as recorder:
+        recorder.attach()
+        for i in range(4):
+            device.getGPIO()
+        recorder.detach()
+
+    capture = qwiic_gpio.QwiicGPIOCapture(mask=0x01)
+    with qwiic_gpio_log.QwiicGPIOLogReader(path) as reader:
+        assert reader.replay(capture.update) == 4
+
+    assert capture.edgeCount(0) == 3
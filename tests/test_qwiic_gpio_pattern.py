@@ -0,0 +1,49 @@
+# Tests for QwiicGPIOPattern, run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _outputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0x00)
+    return driver, device
+
+def test_pattern_plays_every_step():
+    driver, device = _outputDevice()
+
+    pattern = qwiic_gpio.QwiicGPIOPattern(device, [(0x01, 0.002), (0x02, 0.002), (0x04, 0.0)])
+    pattern.start()
+    assert pattern.wait(2.0)
+
+    assert pattern.stepCount == 3
+    assert driver.getRegisters()[1] == 0x04
+
+def test_pattern_survives_bus_errors():
+    driver, device = _outputDevice()
+    driver.injectErrors(1, "write")
+
+    pattern = qwiic_gpio.QwiicGPIOPattern(device, [(0x01, 0.002), (0x02, 0.002), (0x04, 0.0)])
+    pattern.start()
+    assert pattern.wait(2.0)
+
+    assert pattern.stepCount == 3
+    assert pattern.errorCount == 1
+    assert isinstance(pattern.lastException, OSError)
+    assert driver.getRegisters()[1] == 0x04
+
+def test_pattern_records_iterator_failure():
+    driver, device = _outputDevice()
+
+    def steps():
+        yield (0x01, 0.0)
+        raise ValueError("no more steps")
+
+    pattern = qwiic_gpio.QwiicGPIOPattern(device, steps())
+    pattern.start()
+    assert pattern.wait(2.0)
+
+    assert isinstance(pattern.lastException, ValueError)
+    assert driver.getRegisters()[1] == 0x01
@@ -0,0 +1,57 @@
+# Tests for QwiicGPIOPoller, run against the simulated driver:
+#   python -m pytest tests
+
+import time
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _waitFor(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+def _inputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0xFF)
+    return driver, device
+
+def test_poller_reports_edges():
+    driver, device = _inputDevice()
+    edges = []
+    poller = qwiic_gpio.QwiicGPIOPoller(device, rate=1000.0)
+    poller.subscribe(lambda t, pin, value: edges.append((pin, value)), mask=0x02)
+
+    poller.start()
+    try:
+        assert _waitFor(lambda: poller.sampleCount > 2)
+        driver.setInputs(0x00, 0x03)
+        assert _waitFor(lambda: edges == [(1, 0)])
+    finally:
+        poller.stop()
+
+    assert device._lock != None
+
+def test_poller_survives_errors():
+    driver, device = _inputDevice()
+
+    def failing(t, pin, value):
+        raise ValueError("subscriber failed")
+
+    poller = qwiic_gpio.QwiicGPIOPoller(device, rate=1000.0)
+    poller.subscribe(failing)
+
+    poller.start()
+    try:
+        assert _waitFor(lambda: poller.sampleCount > 2)
+        driver.injectErrors(1, "read")
+        assert _waitFor(lambda: poller.errorCount == 1)
+        driver.setInputs(0x00, 0x01)
+        assert _waitFor(lambda: poller.errorCount == 2)
+        assert isinstance(poller.lastError, ValueError)
+        assert poller.isRunning()
+    finally:
+        poller.stop()
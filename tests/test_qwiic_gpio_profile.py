@@ -0,0 +1,66 @@
+# Regression tests for QwiicGPIOProfile, run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _freshDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    return driver, qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+
+def test_partial_profile_leaves_other_pins_alone():
+    # Power-up state: all pins inputs, output register 0xFF
+    driver, device = _freshDevice()
+
+    qwiic_gpio.QwiicGPIOProfile({"pins": {0: {"mode": "out", "level": "high"}}}).apply(device)
+
+    inputPort, output, inversion, configuration = driver.getRegisters()
+    assert configuration == 0xFE
+    assert output == 0xFF
+    assert inversion == 0x00
+
+def test_partial_profile_with_sync():
+    driver, device = _freshDevice()
+
+    qwiic_gpio.QwiicGPIOProfile({"pins": {7: {"mode": "out", "level": "low"}}}).apply(device, sync=True)
+
+    inputPort, output, inversion, configuration = driver.getRegisters()
+    assert configuration == 0x7F
+    assert output == 0x7F
+
+def test_reapply_after_reset():
+    driver, device = _freshDevice()
+    spec = {"pins": dict((pin, {"mode": "out", "level": "high" if pin & 1 else "low"})
+                         for pin in range(8))}
+
+    qwiic_gpio.QwiicGPIOProfile.load(spec).apply(device)
+    assert driver.getRegisters()[1:] == [0xAA, 0x00, 0x00]
+
+    driver.powerCycle()
+    driver.resetStatistics()
+    qwiic_gpio.QwiicGPIOProfile.load(spec).apply(device, reset=True)
+
+    assert driver.getRegisters()[1:] == [0xAA, 0x00, 0x00]
+    assert driver.writeCount == 2
+
+def test_reapply_after_reset_with_sync():
+    driver, device = _freshDevice()
+    spec = {"pins": {0: {"mode": "out", "level": "high"}}}
+
+    qwiic_gpio.QwiicGPIOProfile.load(spec).apply(device)
+    driver.powerCycle()
+    qwiic_gpio.QwiicGPIOProfile.load(spec).apply(device, sync=True)
+
+    assert driver.getRegisters()[3] == 0xFE
+    assert driver.getRegisters()[1] & 0x01
+
+def test_json_address_string():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver([0x27, 0x26])
+    first = qwiic_gpio.QwiicGPIO(0x27, driver)
+    second = qwiic_gpio.QwiicGPIO(0x26, driver)
+
+    profile = qwiic_gpio.QwiicGPIOProfile('{"address": "0x26", "pins": {"1": {"mode": "out"}}}')
+    profile.apply([first, second])
+
+    assert driver.getRegisters(0x26)[3] == 0xFD
+    assert driver.getRegisters(0x27)[3] == 0xFF
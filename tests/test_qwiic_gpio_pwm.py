@@ -0,0 +1,55 @@
+# Tests for QwiicGPIOPWM, run against the simulated driver:
+#   python -m pytest tests
+
+import time
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _waitFor(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+def _outputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0x00)
+    return driver, device
+
+def test_pwm_writes_only_duty_edges():
+    driver, device = _outputDevice()
+    pwm = qwiic_gpio.QwiicGPIOPWM(device, frequency=200.0, resolution=8)
+    pwm.setDuty(0, 0.5)
+    pwm.setDuty(1, 0.5)
+
+    pwm.start()
+    try:
+        assert _waitFor(lambda: pwm.periodCount >= 10)
+    finally:
+        pwm.stop()
+
+    # Both pins switch together: two writes per period
+    assert pwm.writeCount <= 2 * (pwm.periodCount + 1)
+    assert driver.getRegisters()[1] & 0x03 == 0x00
+
+def test_pwm_survives_bus_errors():
+    driver, device = _outputDevice()
+    pwm = qwiic_gpio.QwiicGPIOPWM(device, frequency=200.0, resolution=8)
+    pwm.setDuty(0, 0.5)
+
+    pwm.start()
+    try:
+        assert _waitFor(lambda: pwm.periodCount >= 2)
+        driver.injectErrors(1, "write")
+        assert _waitFor(lambda: pwm.errorCount == 1)
+        periods = pwm.periodCount
+        assert _waitFor(lambda: pwm.periodCount >= periods + 5)
+        assert pwm.isRunning()
+        assert isinstance(pwm.lastError, OSError)
+    finally:
+        pwm.stop(qwiic_gpio.QwiicGPIO.GPIO_HI)
+
+    assert driver.getRegisters()[1] & 0x01
@@ -0,0 +1,99 @@
+# Tests for the retry policy, circuit breaker and write verification, run against the
+# simulated driver:
+#   python -m pytest tests
+
+import time
+
+import pytest
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _outputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0x00)
+    return driver, device
+
+def test_retries_hide_transient_errors():
+    driver, device = _outputDevice()
+    policy = qwiic_gpio.QwiicGPIORetryPolicy(retries=2, backoff=0)
+    device.setRetryPolicy(policy)
+    driver.injectErrors(2, "write")
+
+    device.writePortMask(0x0F)
+
+    assert driver.getRegisters()[1] == 0x0F
+    assert policy.retryCount == 2
+    assert policy.failureCount == 0
+
+def test_circuit_opens_and_recovers():
+    driver, device = _outputDevice()
+    policy = qwiic_gpio.QwiicGPIORetryPolicy(retries=0, backoff=0, failureThreshold=2,
+                                             resetTimeout=0.02)
+    device.setRetryPolicy(policy)
+    driver.injectErrors(2, "read")
+
+    for i in range(2):
+        with pytest.raises(OSError):
+            device.getGPIO()
+    assert policy.isOpen(device.address)
+
+    # Open circuit: rejected without touching the bus
+    driver.resetStatistics()
+    with pytest.raises(OSError):
+        device.getGPIO()
+    assert driver.transactionCount == 0
+    assert policy.rejectedCount == 1
+
+    time.sleep(0.03)
+    device.getGPIO()
+    assert not policy.isOpen(device.address)
+    assert policy.recoveryCount == 1
+
+def test_recovery_rewrites_register_whose_write_failed():
+    driver, device = _outputDevice()
+    device.writePortMask(0xA0)
+    device.setRetryPolicy(qwiic_gpio.QwiicGPIORetryPolicy(retries=0, backoff=0, failureThreshold=1,
+                                                          resetTimeout=0.01))
+    driver.injectErrors(1, "write")
+
+    with pytest.raises(OSError):
+        device.digitalWrite(3, 1)
+    driver.powerCycle()
+    time.sleep(0.02)
+    device.getGPIO()
+
+    assert driver.getRegisters()[1:] == [0xA8, 0x00, 0x00]
+
+def test_verification_detects_reset():
+    driver, device = _outputDevice()
+    device.writePortMask(0x0F)
+    verification = device.enableVerification(everyWrites=10)
+
+    driver.powerCycle()
+    for i in range(20):
+        device.writePortMask(0x0F)
+
+    assert verification.checkCount == 2
+    assert verification.divergenceCount == 1
+    assert driver.getRegisters()[1:] == [0x0F, 0x00, 0x00]
+
+def test_verification_interval_counts_unchanged_writes():
+    driver, device = _outputDevice()
+    device.writePortMask(0x0F)
+    verification = device.enableVerification(everyWrites=0, interval=0)
+
+    driver.powerCycle()
+    device.digitalWrite(0, 1)
+
+    assert verification.checkCount == 1
+    assert driver.getRegisters()[3] == 0x00
+
+def test_check_state_without_reset_is_one_read():
+    driver, device = _outputDevice()
+    driver.resetStatistics()
+
+    assert device.checkState() == 0
+    assert driver.transactionCount == 1
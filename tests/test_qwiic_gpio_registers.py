@@ -0,0 +1,44 @@
+# Tests for the register cache and its list views, run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _inputDevice():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    device.setModeMask(0xFF)
+    return driver, device
+
+def test_digital_read_port_is_detached():
+    driver, device = _inputDevice()
+
+    before = device.digitalReadPort()
+    driver.setInputs(0x00, 0x01)
+    after = device.digitalReadPort()
+
+    assert isinstance(before, list)
+    assert before != after
+    assert before[0] == 1 and after[0] == 0
+
+def test_views_are_live_and_writable():
+    driver, device = _inputDevice()
+    device.setModeMask(0x00)
+
+    device.out_statuses[3] = device.GPIO_HI
+    device.setGPIO()
+
+    assert driver.getRegisters()[1] == 0x08
+    assert device.out_statuses == [0, 0, 0, 1, 0, 0, 0, 0]
+
+def test_unchanged_writes_are_skipped():
+    driver, device = _inputDevice()
+    device.setModeMask(0x00)
+    device.writePortMask(0x55)
+    driver.resetStatistics()
+
+    device.writePortMask(0x55)
+    device.digitalWrite(0, 1)
+
+    assert driver.writeCount == 0
@@ -0,0 +1,63 @@
+# Tests for QwiicBusScheduler, run against the simulated driver:
+#   python -m pytest tests
+
+import threading
+import time
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _waitFor(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+def _runWhileBusy(scheduler, calls):
+    # Hold the bus with a slow read, then queue calls behind it
+    blocker = threading.Thread(target=scheduler.readByte, args=(0x27, 0))
+    blocker.start()
+    assert _waitFor(lambda: scheduler._busy)
+
+    threads = []
+    for call in calls:
+        thread = threading.Thread(target=call)
+        thread.start()
+        threads.append(thread)
+        assert _waitFor(lambda: scheduler.pending() == len(threads) or scheduler.coalescedWrites)
+
+    blocker.join()
+    for thread in threads:
+        thread.join()
+
+def test_same_client_writes_coalesce():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver(latency=0.05)
+    scheduler = qwiic_gpio.QwiicBusScheduler(driver)
+    client = scheduler.client()
+
+    _runWhileBusy(scheduler, [lambda: client.writeByte(0x27, 1, 0x11),
+                              lambda: client.writeByte(0x27, 1, 0x22)])
+
+    assert scheduler.coalescedWrites == 1
+    assert driver.getRegisters()[1] == 0x22
+
+def test_different_client_writes_do_not_coalesce():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver(latency=0.05)
+    scheduler = qwiic_gpio.QwiicBusScheduler(driver)
+    first = qwiic_gpio.QwiicGPIO(i2c_driver=scheduler.client())
+    second = qwiic_gpio.QwiicGPIO(i2c_driver=scheduler.client())
+
+    _runWhileBusy(scheduler, [lambda: first.writePortMask(0x11),
+                              lambda: second.writePortMask(0x22)])
+
+    assert scheduler.coalescedWrites == 0
+    assert driver.writeCount == 2
+    assert driver.getRegisters()[1] == second._chip[1]
+
+def test_other_driver_calls_are_scheduled():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    scheduler = qwiic_gpio.QwiicBusScheduler(driver)
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=scheduler.client(qwiic_gpio.QwiicBusScheduler.PRIORITY_LOW))
+
+    assert device.isConnected()
+    assert scheduler.grantCount[qwiic_gpio.QwiicBusScheduler.PRIORITY_LOW] == 1
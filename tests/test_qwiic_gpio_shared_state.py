@@ -0,0 +1,94 @@
+# Tests for enableSharedState(), run against the simulated driver:
+#   python -m pytest tests
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+shared_memory = pytest.importorskip("multiprocessing.shared_memory")
+pytest.importorskip("fcntl")
+
+def _blockExists(name):
+    try:
+        block = shared_memory.SharedMemory(name)
+    except FileNotFoundError:
+        return False
+    block.close()
+    return True
+
+def _files(name):
+    base = os.path.join(tempfile.gettempdir(), name)
+    return [path for path in (base + ".lock", base + ".users") if os.path.exists(path)]
+
+@pytest.fixture
+def name():
+    return "qwiic_gpio_test_%d" % os.getpid()
+
+def test_cache_is_shared(name):
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    first = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    second = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    first.enableSharedState(name)
+    second.enableSharedState(name)
+    try:
+        first.setModeMask(0x00)
+        first.digitalWrite(0, 1)
+        second.digitalWrite(1, 1)
+
+        assert driver.getRegisters()[1] == 0x03
+        assert first._shadow[1] == 0x03
+    finally:
+        first.disableSharedState()
+        second.disableSharedState()
+
+def test_last_user_removes_block_and_files(name):
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    first = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    second = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    first.enableSharedState(name)
+    second.enableSharedState(name)
+
+    first.disableSharedState()
+    assert _blockExists(name)
+
+    second.disableSharedState()
+    assert not _blockExists(name)
+    assert _files(name) == []
+
+def test_stale_block_is_not_adopted(name):
+    # A process that exits without detaching leaves the block behind
+    code = ("import os, qwiic_gpio, qwiic_gpio_sim\n"
+            "device = qwiic_gpio.QwiicGPIO(i2c_driver=qwiic_gpio_sim.QwiicGPIOSimDriver())\n"
+            "device.enableSharedState(%r)\n"
+            "device.setModeMask(0x00)\n"
+            "os._exit(0)\n" % name)
+    subprocess.run([sys.executable, "-c", code], check=True, env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=qwiic_gpio_sim.QwiicGPIOSimDriver())
+    device.enableSharedState(name)
+    try:
+        assert device._known[0] == 0
+    finally:
+        device.disableSharedState()
+
+    assert not _blockExists(name)
+
+def test_default_name_needs_the_bus():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+
+    with pytest.raises(ValueError):
+        device.enableSharedState()
+
+    driver._iBus = 7
+    device.enableSharedState()
+    try:
+        assert _blockExists("qwiic_gpio_7_27")
+    finally:
+        device.disableSharedState()
@@ -0,0 +1,64 @@
+# Tests for the simulated driver itself:
+#   python -m pytest tests
+
+import pytest
+
+import qwiic_gpio_sim
+
+def test_power_up_state():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+
+    assert driver.getRegisters() == [0xFF, 0xFF, 0x00, 0xFF]
+    assert driver.isDeviceConnected(0x27)
+    assert not driver.isDeviceConnected(0x20)
+
+def test_input_register_follows_pins_and_inversion():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    driver.writeByte(0x27, 3, 0xF0)
+    driver.writeByte(0x27, 1, 0x05)
+    driver.setInputs(0x30, 0xF0)
+
+    assert driver.getPins() == 0x35
+    assert driver.readByte(0x27, 0) == 0x35
+
+    driver.writeByte(0x27, 2, 0x0F)
+    assert driver.readByte(0x27, 0) == 0x3A
+
+def test_waveform_plays_one_step_per_read():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    driver.setInputWaveform([0x01, 0x02])
+
+    assert [driver.readByte(0x27, 0) for i in range(3)] == [0x01, 0x02, 0x02]
+
+def test_block_reads_do_not_auto_increment_by_default():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    driver.writeByte(0x27, 3, 0x0F)
+
+    assert driver.readBlock(0x27, 0, 4) == [0xFF] * 4
+
+    incrementing = qwiic_gpio_sim.QwiicGPIOSimDriver(autoIncrement=True)
+    incrementing.writeByte(0x27, 3, 0x0F)
+    assert list(incrementing.readBlock(0x27, 0, 4)) == [0xFF, 0xFF, 0x00, 0x0F]
+
+def test_injected_errors_and_statistics():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+    driver.injectErrors(1, "write", register=1)
+
+    driver.writeByte(0x27, 3, 0x00)
+    with pytest.raises(OSError):
+        driver.writeByte(0x27, 1, 0x00)
+    driver.writeByte(0x27, 1, 0x00)
+    driver.readByte(0x27, 0)
+
+    assert driver.errorCount == 1
+    assert driver.writeCount == 3
+    assert driver.readCount == 1
+
+    driver.resetStatistics()
+    assert driver.transactionCount == 0
+
+def test_missing_device_nacks():
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver()
+
+    with pytest.raises(OSError):
+        driver.readByte(0x20, 0)
@@ -0,0 +1,59 @@
+# Tests for snapshot(), run against the simulated driver:
+#   python -m pytest tests
+
+import qwiic_gpio
+import qwiic_gpio_sim
+
+def _freshDevice(autoIncrement=False):
+    driver = qwiic_gpio_sim.QwiicGPIOSimDriver(autoIncrement=autoIncrement)
+    device = qwiic_gpio.QwiicGPIO(i2c_driver=driver)
+    device.begin()
+    return driver, device
+
+def test_snapshot_reads_registers_singly_by_default():
+    driver, device = _freshDevice()
+    device.setModeMask(0x0F)
+    driver.resetStatistics()
+
+    snap = device.snapshot()
+
+    assert snap.configuration == 0x0F
+    assert driver.readCount == 4
+    assert device.burst_read == False
+
+def test_burst_check_ignores_equal_bytes():
+    # A chip that does not auto-increment returns the input register four times
+    driver, device = _freshDevice()
+    device.setModeMask(0x00)
+    device.writePortMask(0x00)
+    device.burst_read = None
+
+    device.snapshot()
+    assert device.burst_read == None
+
+    device.writePortMask(0xF0)
+    snap = device.snapshot()
+    assert snap.inversion == 0x00
+    assert snap.configuration == 0x00
+
+def test_burst_read_on_auto_increment_chip():
+    driver, device = _freshDevice(autoIncrement=True)
+    device.setModeMask(0x0F)
+    device.burst_read = None
+
+    device.snapshot()
+    assert device.burst_read == True
+
+    driver.resetStatistics()
+    assert device.snapshot().configuration == 0x0F
+    assert driver.transactionCount == 1
+
+def test_snapshot_keeps_pending_batch_writes():
+    driver, device = _freshDevice()
+    device.setModeMask(0x00)
+
+    with device.batch():
+        device.digitalWrite(0, 1)
+        device.snapshot()
+
+    assert driver.getRegisters()[1] & 0x01